@@ -0,0 +1 @@
+"""Пакет микробенчмарков приложения."""
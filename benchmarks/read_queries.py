@@ -0,0 +1,173 @@
+"""Модуль микробенчмарка запросов чтения репозиториев.
+
+Сравнивает одни и те же запросы в двух видах: построенные заново при каждом
+вызове с идентификатором в условии и заранее построенные запросы
+репозиториев с параметрами bindparam(). Построение (со сборкой SQL для
+диалекта базы данных) и выполнение замеряются отдельно. Запуск из корня
+проекта: python -m benchmarks.read_queries [число повторов]. Используются
+переменные окружения приложения, в базе должно быть хотя бы одно под-меню.
+"""
+import asyncio
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from uuid import UUID
+
+from sqlalchemy import Executable, Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from menu_app.database import async_engine, async_session
+from menu_app.models import Dish, Menu, Submenu
+from menu_app.repositories.app_repository import build_tree_query, tree_query
+from menu_app.repositories.dish_repository import repository as dish_repository
+from menu_app.repositories.menu_repository import repository as menu_repository
+
+
+def build_menu_query(menu_id: UUID) -> Select:
+    """
+    Функция строит запрос меню так, как он строился при каждом вызове до \
+    появления заранее построенных запросов.
+
+    :param menu_id: Идентификатор меню.
+    :return: Запрос меню.
+    """
+    query: Select = select(
+        Menu.id,
+        Menu.title,
+        Menu.description,
+        Menu.submenus_count,
+        Menu.dishes_count
+    )
+    return query.filter(Menu.id == menu_id)
+
+
+def build_dish_list_query(submenu_id: UUID) -> Select:
+    """
+    Функция строит запрос списка блюд так, как он строился при каждом \
+    вызове до появления заранее построенных запросов.
+
+    :param submenu_id: Идентификатор под-меню.
+    :return: Запрос списка блюд.
+    """
+    query: Select = select(
+        Dish.id,
+        Dish.title,
+        Dish.description,
+        func.round(Dish.current_price, 2).label('price')
+    )
+    return query.filter(Dish.submenu_id == submenu_id)
+
+
+async def fetch(
+        db: AsyncSession,
+        query: Executable,
+        params: dict | None = None
+) -> list:
+    """
+    Функция выполняет запрос и получает все строки результата.
+
+    :param db: Экземпляр сеанса базы данных.
+    :param query: Запрос.
+    :param params: Значения параметров запроса.
+    :return: Строки результата.
+    """
+    result = await db.execute(query, params)
+    return list(result.all())
+
+
+def measure(call: Callable[[], object], number: int) -> float:
+    """
+    Функция возвращает среднее время вызова в микросекундах.
+
+    :param call: Замеряемая функция.
+    :param number: Число повторов.
+    :return: Среднее время вызова в микросекундах.
+    """
+    started = time.perf_counter()
+    for _ in range(number):
+        call()
+    return (time.perf_counter() - started) / number * 1e6
+
+
+async def measure_async(
+        call: Callable[[], Awaitable[object]],
+        number: int
+) -> float:
+    """
+    Функция возвращает среднее время асинхронного вызова в микросекундах. \
+    Первый вызов не замеряется, чтобы запрос успел попасть в кэши.
+
+    :param call: Замеряемая функция.
+    :param number: Число повторов.
+    :return: Среднее время вызова в микросекундах.
+    """
+    await call()
+    started = time.perf_counter()
+    for _ in range(number):
+        await call()
+    return (time.perf_counter() - started) / number * 1e6
+
+
+async def main(number: int) -> None:
+    """
+    Функция выводит среднее время построения и выполнения запросов до и \
+    после перехода на заранее построенные запросы.
+
+    Построение до перехода - создание запроса и сборка его SQL, после - \
+    только сборка SQL готового запроса. Запросы для замера выполнения до \
+    перехода строятся заранее, по одному на вызов, чтобы в замер попало \
+    только выполнение.
+
+    :param number: Число повторов.
+    :return: None.
+    """
+    dialect = async_engine.dialect
+    async with async_session() as db:
+        row = (
+            await db.execute(
+                select(Submenu.menu_id, Submenu.id).limit(1)
+            )
+        ).first()
+        if row is None:
+            print('В базе нет ни одного под-меню.')
+            return
+        menu_id, submenu_id = row
+        cases = (
+            (
+                'menu',
+                lambda: build_menu_query(menu_id),
+                menu_repository.get_query,
+                {'menu_id': menu_id}
+            ),
+            (
+                'dish list',
+                lambda: build_dish_list_query(submenu_id),
+                dish_repository.list_query,
+                {'submenu_id': submenu_id}
+            ),
+            ('tree', build_tree_query, tree_query, None),
+        )
+        rows = []
+        for name, build, prebuilt, params in cases:
+            rows.append((
+                f'{name}: build',
+                measure(lambda: build().compile(dialect=dialect), number),
+                measure(lambda: prebuilt.compile(dialect=dialect), number)
+            ))
+            queries = iter([build() for _ in range(number + 1)])
+            rows.append((
+                f'{name}: execute',
+                await measure_async(lambda: fetch(db, next(queries)), number),
+                await measure_async(
+                    lambda: fetch(db, prebuilt, params),
+                    number
+                )
+            ))
+    await async_engine.dispose()
+    print(f'{"query":<20}{"before, us":>14}{"after, us":>14}')
+    for name, before, after in rows:
+        print(f'{name:<20}{before:>14.1f}{after:>14.1f}')
+
+
+if __name__ == '__main__':
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000))
@@ -0,0 +1,50 @@
+"""Модуль инициализации общего для процесса клиента Redis с пулом \
+соединений, а также общих для приложения и фоновых задач имен канала \
+оповещений и шаблонов тегов кэша."""
+import aioredis
+
+from menu_app.config import config
+
+INVALIDATION_CHANNEL = 'cache.invalidate'
+FLUSH_MESSAGE = '*'
+WARM_UP_MESSAGE = 'warm_up'
+TAG_LIFETIME = 24 * 60 * 60
+TAG_GLOBAL = 'gen.global'
+TAG_MENU = 'gen.menu.%(menu_id)s'
+TAG_SUBMENU = 'gen.submenu.%(submenu_id)s'
+
+redis_client: aioredis.Redis | None = None
+
+
+def get_redis() -> aioredis.Redis:
+    """
+    Функция возвращает общий для процесса клиент Redis, создавая его при \
+    первом обращении. Пул соединений ограничен по размеру, при его исчерпании\
+    запрос ожидает освободившееся соединение не дольше REDIS_POOL_TIMEOUT.
+
+    :return: Клиент Redis.
+    """
+    global redis_client
+    if redis_client is None:
+        pool = aioredis.BlockingConnectionPool.from_url(
+            config.url_redis,
+            max_connections=config.REDIS_MAX_CONNECTIONS,
+            timeout=config.REDIS_POOL_TIMEOUT,
+            socket_timeout=config.REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=config.REDIS_SOCKET_CONNECT_TIMEOUT,
+        )
+        redis_client = aioredis.Redis(connection_pool=pool)
+    return redis_client
+
+
+async def close_redis() -> None:
+    """
+    Функция закрывает все соединения пула и сбрасывает клиент Redis.
+
+    :return: None.
+    """
+    global redis_client
+    if redis_client is not None:
+        await redis_client.close()
+        await redis_client.connection_pool.disconnect()
+        redis_client = None
@@ -16,9 +16,59 @@ class Config(ABC):
     POSTGRES_PORT: str | None = getenv('POSTGRES_PORT')
     POSTGRES_HOST: str | None = getenv('POSTGRES_HOST')
     POSTGRES_DB: str | None = getenv('POSTGRES_DB')
+    POSTGRES_REPLICA_HOST: str | None = getenv('POSTGRES_REPLICA_HOST')
+    POSTGRES_REPLICA_PORT: str | None = (
+        getenv('POSTGRES_REPLICA_PORT') or POSTGRES_PORT
+    )
+    POSTGRES_REPLICA_DB: str | None = (
+        getenv('POSTGRES_REPLICA_DB') or POSTGRES_DB
+    )
+    DB_REPLICA_MAX_LAG: float = float(getenv('DB_REPLICA_MAX_LAG', '1'))
     TEST_DB: str | None = getenv('TEST_DB')
     TEST_HOST_DB: str | None = getenv('TEST_HOST_DB')
+    DB_POOL_SIZE: int = int(getenv('DB_POOL_SIZE', '5'))
+    DB_MAX_OVERFLOW: int = int(getenv('DB_MAX_OVERFLOW', '10'))
+    DB_POOL_TIMEOUT: float = float(getenv('DB_POOL_TIMEOUT', '30'))
+    DB_POOL_RECYCLE: int = int(getenv('DB_POOL_RECYCLE', '-1'))
+    DB_POOL_PRE_PING: bool = (
+        getenv('DB_POOL_PRE_PING', 'false').lower() == 'true'
+    )
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = int(
+        getenv('DB_PREPARED_STATEMENT_CACHE_SIZE', '100')
+    )
     REDIS_HOST: str | None = getenv('REDIS_HOST')
+    REDIS_MAX_CONNECTIONS: int = int(getenv('REDIS_MAX_CONNECTIONS', '50'))
+    REDIS_POOL_TIMEOUT: float = float(getenv('REDIS_POOL_TIMEOUT', '5'))
+    REDIS_SOCKET_TIMEOUT: float = float(getenv('REDIS_SOCKET_TIMEOUT', '2'))
+    REDIS_SOCKET_CONNECT_TIMEOUT: float = float(
+        getenv('REDIS_SOCKET_CONNECT_TIMEOUT', '2')
+    )
+    L1_CACHE_MAX_ITEMS: int = int(getenv('L1_CACHE_MAX_ITEMS', '1024'))
+    L1_CACHE_MAX_BYTES: int = int(getenv('L1_CACHE_MAX_BYTES', '33554432'))
+    L1_CACHE_TTL: float = float(getenv('L1_CACHE_TTL', '5'))
+    CACHE_TTL_TREE: int = int(getenv('CACHE_TTL_TREE', '15'))
+    CACHE_TTL_LIST: int = int(getenv('CACHE_TTL_LIST', '15'))
+    CACHE_TTL_DETAIL: int = int(getenv('CACHE_TTL_DETAIL', '15'))
+    CACHE_TTL_JITTER: float = float(getenv('CACHE_TTL_JITTER', '0.1'))
+    CACHE_STALE_TTL: int = int(getenv('CACHE_STALE_TTL', '30'))
+    CACHE_NOT_FOUND_TTL: int = int(getenv('CACHE_NOT_FOUND_TTL', '5'))
+    CACHE_COMPRESS_MIN_BYTES: int = int(
+        getenv('CACHE_COMPRESS_MIN_BYTES', '1024')
+    )
+    CACHE_COMPRESS_LEVEL: int = int(getenv('CACHE_COMPRESS_LEVEL', '6'))
+    CACHE_LOCK_TIMEOUT: float = float(getenv('CACHE_LOCK_TIMEOUT', '5'))
+    CACHE_LOCK_WAIT: float = float(getenv('CACHE_LOCK_WAIT', '5'))
+    CACHE_WARM_UP_CONCURRENCY: int = int(
+        getenv('CACHE_WARM_UP_CONCURRENCY', '4')
+    )
+    CACHE_WARM_UP_ON_STARTUP: bool = (
+        getenv('CACHE_WARM_UP_ON_STARTUP', 'false').lower() == 'true'
+    )
+    CACHE_STATS_FLUSH_INTERVAL: float = float(
+        getenv('CACHE_STATS_FLUSH_INTERVAL', '1')
+    )
+    PAGE_MAX_LIMIT: int = int(getenv('PAGE_MAX_LIMIT', '100'))
+    DISH_BULK_MAX_ITEMS: int = int(getenv('DISH_BULK_MAX_ITEMS', '1000'))
     RABBITMQ_DEFAULT_USER: str | None = getenv('RABBITMQ_DEFAULT_USER')
     RABBITMQ_DEFAULT_PASS: str | None = getenv('RABBITMQ_DEFAULT_PASS')
     RABBITMQ_HOST: str | None = getenv('RABBITMQ_HOST')
@@ -27,6 +77,12 @@ class Config(ABC):
         f'postgresql+asyncpg://{POSTGRES_USER}:{POSTGRES_PASSWORD}@'
         f'{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}'
     )
+    async_replica_url: str | None = (
+        f'postgresql+asyncpg://{POSTGRES_USER}:{POSTGRES_PASSWORD}@'
+        f'{POSTGRES_REPLICA_HOST}:{POSTGRES_REPLICA_PORT}/'
+        f'{POSTGRES_REPLICA_DB}'
+        if POSTGRES_REPLICA_HOST else None
+    )
     sync_sqlalchemy_url: str = (
         f'postgresql://{POSTGRES_USER}:{POSTGRES_PASSWORD}@'
         f'{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}'
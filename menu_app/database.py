@@ -1,31 +1,99 @@
 """Модуль инициализации базы данных и сеанса работы с БД."""
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+import time
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 
 from menu_app.config import config
 
-Base = declarative_base()
-async_engine = create_async_engine(config.async_sqlalchemy_url)
 
+def get_engine(url: str) -> AsyncEngine:
+    """
+    Функция создает асинхронный движок базы данных с настройками пула \
+    соединений и размером кэша подготовленных выражений asyncpg на каждое \
+    соединение из конфигурации.
 
-async def get_db():
+    :param url: Адрес базы данных.
+    :return: Асинхронный движок базы данных.
     """
-    Функция инициализирует сеанса базы данных и возвращает его в виде \
-    генератора, пока приложение работает.
+    return create_async_engine(
+        url,
+        pool_size=config.DB_POOL_SIZE,
+        max_overflow=config.DB_MAX_OVERFLOW,
+        pool_timeout=config.DB_POOL_TIMEOUT,
+        pool_recycle=config.DB_POOL_RECYCLE,
+        pool_pre_ping=config.DB_POOL_PRE_PING,
+        connect_args={
+            'prepared_statement_cache_size': (
+                config.DB_PREPARED_STATEMENT_CACHE_SIZE
+            )
+        },
+    )
 
-    :return: Экземпляр сеанса базы данных.
+
+def get_sessionmaker(engine: AsyncEngine) -> sessionmaker:
     """
-    async_session = sessionmaker(
+    Функция создает фабрику сеансов базы данных, привязанных к движку.
+
+    :param engine: Асинхронный движок базы данных.
+    :return: Фабрика сеансов.
+    """
+    return sessionmaker(
         expire_on_commit=False,
         autocommit=False,
         autoflush=False,
-        bind=async_engine,
+        bind=engine,
         class_=AsyncSession,
     )
 
-    async with async_session() as session:
-        await session.begin()
 
+Base = declarative_base()
+async_engine = get_engine(config.async_sqlalchemy_url)
+async_session = get_sessionmaker(async_engine)
+replica_engine = (
+    get_engine(config.async_replica_url)
+    if config.async_replica_url else async_engine
+)
+async_read_session = get_sessionmaker(replica_engine)
+primary_until: float = 0.0
+
+
+def hold_primary() -> None:
+    """
+    Функция направляет чтения процесса на основную базу данных на время \
+    DB_REPLICA_MAX_LAG после изменения данных, чтобы кэш не заполнился \
+    отстающими данными реплики.
+
+    :return: None.
+    """
+    global primary_until
+    primary_until = time.monotonic() + config.DB_REPLICA_MAX_LAG
+
+
+async def get_db():
+    """
+    Функция инициализирует сеанса базы данных и возвращает его в виде \
+    генератора, пока приложение работает. Соединение берется из пула только\
+    при первом запросе к базе данных, поэтому ответы из кэша не занимают \
+    соединений. При закрытии сеанса незафиксированная транзакция \
+    откатывается, а соединение возвращается в пул.
+
+    :return: Экземпляр сеанса базы данных.
+    """
+    async with async_session() as session:
         yield session
 
-        await session.rollback()
+
+async def get_read_db():
+    """
+    Функция возвращает сеанс базы данных для get-запросов. Если задан \
+    POSTGRES_REPLICA_HOST, сеанс открывается на реплике, кроме времени \
+    сразу после изменения данных, когда чтения идут на основную базу.
+
+    :return: Экземпляр сеанса базы данных только для чтения.
+    """
+    session_maker = async_read_session
+    if time.monotonic() < primary_until:
+        session_maker = async_session
+    async with session_maker() as session:
+        yield session
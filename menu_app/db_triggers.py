@@ -0,0 +1,72 @@
+"""Модуль хранит DDL функций и триггеров PostgreSQL, поддерживающих \
+счетчики под-меню и блюд. Используется и при создании таблиц моделей, и в \
+миграциях, чтобы схема в обоих случаях была одинаковой."""
+
+DISHES_COUNT_FUNCTION = """
+    CREATE OR REPLACE FUNCTION dishes_count_trigger()
+    RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'UPDATE'
+                AND OLD.submenu_id IS NOT DISTINCT FROM NEW.submenu_id THEN
+            RETURN NULL;
+        END IF;
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            UPDATE submenus SET dishes_count = dishes_count - 1
+            WHERE id = OLD.submenu_id;
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            UPDATE submenus SET dishes_count = dishes_count + 1
+            WHERE id = NEW.submenu_id;
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+"""
+DISHES_COUNT_TRIGGER = """
+    CREATE TRIGGER dishes_count
+    AFTER INSERT OR DELETE OR UPDATE OF submenu_id ON dishes
+    FOR EACH ROW EXECUTE FUNCTION dishes_count_trigger()
+"""
+SUBMENUS_COUNT_FUNCTION = """
+    CREATE OR REPLACE FUNCTION submenus_count_trigger()
+    RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'UPDATE'
+                AND OLD.menu_id IS NOT DISTINCT FROM NEW.menu_id THEN
+            UPDATE menus
+            SET dishes_count = dishes_count
+                + NEW.dishes_count - OLD.dishes_count
+            WHERE id = NEW.menu_id;
+            RETURN NULL;
+        END IF;
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            UPDATE menus
+            SET submenus_count = submenus_count - 1,
+                dishes_count = dishes_count - OLD.dishes_count
+            WHERE id = OLD.menu_id;
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            UPDATE menus
+            SET submenus_count = submenus_count + 1,
+                dishes_count = dishes_count + NEW.dishes_count
+            WHERE id = NEW.menu_id;
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+"""
+SUBMENUS_COUNT_TRIGGER = """
+    CREATE TRIGGER submenus_count
+    AFTER INSERT OR DELETE OR UPDATE OF menu_id, dishes_count ON submenus
+    FOR EACH ROW EXECUTE FUNCTION submenus_count_trigger()
+"""
+
+# Счетчики menus.submenus_count, menus.dishes_count и submenus.dishes_count
+# поддерживаются триггерами при любых изменениях, в том числе каскадных
+# удалениях и массовом обновлении из фоновой задачи.
+COUNTER_TRIGGERS = (
+    DISHES_COUNT_FUNCTION,
+    DISHES_COUNT_TRIGGER,
+    SUBMENUS_COUNT_FUNCTION,
+    SUBMENUS_COUNT_TRIGGER,
+)
@@ -1,9 +1,13 @@
 """Модуль запуска приложения."""
+import asyncio
+
 from fastapi import APIRouter, FastAPI
 
-from menu_app.database import Base, async_engine
+from menu_app.cache import close_redis, get_redis
+from menu_app.config import config
 from menu_app.routers import app_router, dish_router, menu_router, submenu_router
-from menu_app.services.base_service import BaseService
+from menu_app.services.app_service import service as app_service
+from menu_app.services.base_service import BaseService, cache_stats
 
 app: FastAPI = FastAPI(
     title='Menu API',
@@ -22,22 +26,34 @@ app.include_router(router)
 @app.on_event('startup')
 async def startup() -> None:
     """
-    Функция выполняет задачи при запуске системы. На текущий момент подключена\
-    задача на создание моделей базы данных при запуске приложения.
+    Функция выполняет задачи при запуске системы: создание общего для \
+    процесса пула соединений с Redis, подписки на оповещения об удалении \
+    кэша и периодического сброса статистики кэша в Redis. При \
+    CACHE_WARM_UP_ON_STARTUP кэш прогревается до начала обработки запросов.\
+    Схема базы данных создается отдельно миграциями Alembic.
 
     :return: None.
     """
-    async with async_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    get_redis()
+    app.state.invalidation_listener = asyncio.create_task(
+        app_service.listen_invalidation()
+    )
+    app.state.stats_flusher = asyncio.create_task(cache_stats.run())
+    if config.CACHE_WARM_UP_ON_STARTUP:
+        await app_service.warm_up()
 
 
 @app.on_event('shutdown')
 async def shutdown() -> None:
     """
-    Функция вызывает функцию удаления записей кэша запросов из Redis при\
-    остановке приложения.
+    Функция останавливает фоновые задачи, вызывает функцию удаления \
+    записей кэша запросов из Redis при остановке приложения и закрывает \
+    пул соединений с Redis.
 
     :return: None.
     """
+    app.state.invalidation_listener.cancel()
+    app.state.stats_flusher.cancel()
     service = BaseService()
     await service.flush_redis()
+    await close_redis()
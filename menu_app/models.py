@@ -2,11 +2,22 @@
 import decimal
 import uuid
 
-from sqlalchemy import UUID, Column, ForeignKey, Integer, Numeric, String
+from sqlalchemy import (
+    DDL,
+    UUID,
+    Column,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    event,
+)
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, relationship
 
 from menu_app.database import Base
+from menu_app.db_triggers import COUNTER_TRIGGERS
 
 
 class Menu(Base):
@@ -28,6 +39,16 @@ class Menu(Base):
         String,
         nullable=True,
     )
+    submenus_count: Mapped[int] = Column(
+        Integer,
+        nullable=False,
+        server_default='0'
+    )
+    dishes_count: Mapped[int] = Column(
+        Integer,
+        nullable=False,
+        server_default='0'
+    )
     submenus: Mapped[list['Submenu']] = relationship(
         'Submenu',
         back_populates='menu'
@@ -39,6 +60,9 @@ class Submenu(Base):
         блюд в меню ресторана."""
 
     __tablename__ = 'submenus'
+    __table_args__ = (
+        Index('ix_submenus_menu_id_id', 'menu_id', 'id'),
+    )
     id: Mapped[uuid.UUID] = Column(
         UUID,
         primary_key=True,
@@ -57,6 +81,11 @@ class Submenu(Base):
         UUID,
         ForeignKey('menus.id', ondelete='CASCADE')
     )
+    dishes_count: Mapped[int] = Column(
+        Integer,
+        nullable=False,
+        server_default='0'
+    )
     menu: Mapped[list['Menu']] = relationship(
         'Menu',
         back_populates='submenus'
@@ -72,6 +101,9 @@ class Dish(Base):
     ресторана."""
 
     __tablename__ = 'dishes'
+    __table_args__ = (
+        Index('ix_dishes_submenu_id_id', 'submenu_id', 'id'),
+    )
     id: Mapped[uuid.UUID] = Column(
         UUID,
         primary_key=True,
@@ -108,3 +140,11 @@ class Dish(Base):
         if self.discount:
             return self.price - (self.price * self.discount / 100)
         return self.price
+
+
+for trigger in COUNTER_TRIGGERS:
+    event.listen(
+        Dish.__table__,
+        'after_create',
+        DDL(trigger).execute_if(dialect='postgresql')
+    )
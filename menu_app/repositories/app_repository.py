@@ -1,56 +1,95 @@
 """Модуль хранит в себе функции приложения, связанные с работой БД со всеми\
 существующими сущностями."""
-from sqlalchemy import Sequence, func, select
+from sqlalchemy import JSON, Select, Text, cast, func, literal, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from menu_app.models import Dish, Menu, Submenu
 
 
-async def get_tree_menu_repository(db: AsyncSession) -> Sequence:
+def build_tree_query() -> Select:
     """
-    Функция возвращает древовидное меню.
+    Функция строит запрос древовидного меню. Документ JSON целиком \
+    собирается в PostgreSQL функциями json_agg и json_build_object и \
+    возвращается одним текстовым значением, поэтому приложению не нужно \
+    разбирать, проверять и заново сериализовать каждое блюдо. Элементы \
+    упорядочены по идентификатору, чтобы одинаковые данные давали одинаковый\
+    ответ. Цена приводится к строке с двумя знаками после запятой, как и в \
+    остальных ответах API.
 
-    :param db: Экземпляром сеанса базы данных.
-    :return: Список всех меню, связанных под-меню и блюд в виде дерева JSON.
+    :return: Запрос древовидного меню.
     """
-    subquery = (
+    dishes = (
         select(
-            Submenu.id,
-            Submenu.title,
-            Submenu.description,
-            Submenu.menu_id,
-            func.array_agg(
-                func.json_build_object(
-                    'id', Dish.id,
-                    'title', Dish.title,
-                    'description', Dish.description,
-                    'price', func.round(Dish.current_price, 2)
+            Dish.submenu_id,
+            func.json_agg(
+                aggregate_order_by(
+                    func.json_build_object(
+                        'id', Dish.id,
+                        'title', Dish.title,
+                        'description', Dish.description,
+                        'price', cast(func.round(Dish.current_price, 2), Text)
+                    ),
+                    Dish.id
                 )
-            ).filter(Dish.id.is_not(None)).label('dishes')
+            ).label('dishes')
         )
-        .outerjoin(Dish, Submenu.id == Dish.submenu_id)
-        .group_by(Submenu.id)
-        .subquery('subquery')
+        .group_by(Dish.submenu_id)
+        .subquery('dishes')
     )
-    query = (
+    submenus = (
         select(
-            Menu.id,
-            Menu.title,
-            Menu.description,
-            func.array_agg(
-                func.json_build_object(
-                    'id', subquery.c.id,
-                    'title', subquery.c.title,
-                    'description', subquery.c.description,
-                    'dishes', subquery.c.dishes
+            Submenu.menu_id,
+            func.json_agg(
+                aggregate_order_by(
+                    func.json_build_object(
+                        'id', Submenu.id,
+                        'title', Submenu.title,
+                        'description', Submenu.description,
+                        'dishes', dishes.c.dishes
+                    ),
+                    Submenu.id
                 )
-            ).filter(subquery.c.id.is_not(None)).label('submenus')
+            ).label('submenus')
         )
-        .outerjoin(
-            subquery, Menu.id == subquery.c.menu_id
+        .outerjoin(dishes, Submenu.id == dishes.c.submenu_id)
+        .group_by(Submenu.menu_id)
+        .subquery('submenus')
+    )
+    return (
+        select(
+            cast(
+                func.coalesce(
+                    func.json_agg(
+                        aggregate_order_by(
+                            func.json_build_object(
+                                'id', Menu.id,
+                                'title', Menu.title,
+                                'description', Menu.description,
+                                'submenus', submenus.c.submenus
+                            ),
+                            Menu.id
+                        )
+                    ),
+                    cast(literal('[]'), JSON)
+                ),
+                Text
+            )
         )
-        .group_by(Menu.id)
+        .select_from(Menu)
+        .outerjoin(submenus, Menu.id == submenus.c.menu_id)
     )
-    result = await db.stream(query)
-    curr = await result.mappings().all()
-    return curr
+
+
+tree_query = build_tree_query()
+
+
+async def get_tree_menu_repository(db: AsyncSession) -> str:
+    """
+    Функция возвращает древовидное меню запросом, построенным один раз при \
+    загрузке модуля.
+
+    :param db: Экземпляром сеанса базы данных.
+    :return: Список всех меню, связанных под-меню и блюд в виде дерева JSON.
+    """
+    return await db.scalar(tree_query)
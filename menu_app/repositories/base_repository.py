@@ -1,11 +1,25 @@
 """Модуль Конфигурация используется для вынесения общих и часто используемых\
 функций."""
+from typing import Any
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy import Executable, RowMapping, Select, bindparam
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
 class BaseRepository:
-    """Базовый класс операций с репозиторием."""
+    """
+    Базовый класс операций с репозиторием.
+
+    Горячие запросы чтения строятся один раз при создании репозитория, а \
+    значения передаются в них через параметры: так SQLAlchemy не собирает \
+    дерево выражения и не вычисляет ключ кэша компиляции при каждом вызове.
+    """
+
+    model: Any
+    page_queries: tuple[Select, Select]
 
     @classmethod
     async def data_commit(cls, db: AsyncSession, entity_model) -> None:
@@ -27,3 +41,77 @@ class BaseRepository:
             raise RuntimeError(error) from e
         finally:
             await db.close()
+
+    @classmethod
+    async def returning_commit(
+            cls,
+            db: AsyncSession,
+            query: Executable,
+            detail: str
+    ) -> RowMapping:
+        """
+        Метод выполняет запрос UPDATE или DELETE с RETURNING и сохраняет \
+        изменения в базе данных за одно обращение к ней. Если ни одна строка \
+        не была затронута, возвращается ошибка 404.
+
+        :param db: Экземпляром сеанса базы данных.
+        :param query: Запрос изменения с указанием возвращаемых полей.
+        :param detail: Сообщение об ошибке, если сущность не найдена.
+        :return: Возвращенные запросом поля сущности.
+        """
+        try:
+            result = await db.execute(query)
+            entity = result.mappings().first()
+            await db.commit()
+        except SQLAlchemyError as e:
+            error = str(e.__cause__)
+            await db.rollback()
+            raise RuntimeError(error) from e
+        if entity is None:
+            raise HTTPException(status_code=404, detail=detail)
+        return entity
+
+    def build_page_queries(self, query: Select) -> tuple[Select, Select]:
+        """
+        Метод один раз строит по запросу списка запросы первой и следующих \
+        страниц. Строки упорядочиваются по идентификатору и выбираются \
+        строго после курсора, поэтому запрос идет по индексу и его стоимость \
+        не зависит от номера страницы.
+
+        :param query: Запрос списка без сортировки и ограничения.
+        :return: Запросы первой страницы и страницы после курсора.
+        """
+        first = query.order_by(self.model.id)
+        first = first.limit(bindparam('limit'))
+        return first, first.filter(self.model.id > bindparam('after'))
+
+    async def get_page(
+            self,
+            db: AsyncSession,
+            params: dict,
+            limit: int,
+            after: UUID | None
+    ) -> dict:
+        """
+        Метод получения страницы списка по курсору запросами, построенными \
+        методом build_page_queries. Выбирается на одну строку больше, чтобы \
+        узнать о наличии следующей страницы.
+
+        :param db: Экземпляром сеанса базы данных.
+        :param params: Параметры запроса списка.
+        :param limit: Размер страницы.
+        :param after: Идентификатор последней строки предыдущей страницы.
+        :return: Строки страницы и курсор следующей страницы.
+        """
+        first, following = self.page_queries
+        params = {**params, 'limit': limit + 1}
+        if after is None:
+            result = await db.stream(first, params)
+        else:
+            result = await db.stream(following, {**params, 'after': after})
+        rows = await result.mappings().all()
+        items = rows[:limit]
+        return {
+            'items': items,
+            'next': items[-1]['id'] if len(rows) > limit else None
+        }
@@ -2,9 +2,10 @@
 from uuid import UUID, uuid4
 
 from fastapi import HTTPException
-from sqlalchemy import RowMapping, Sequence, delete, func, select
+from sqlalchemy import RowMapping, Sequence, bindparam, delete, func, select, update
+from sqlalchemy.dialects.postgresql import Insert, insert
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
-from starlette.responses import JSONResponse
 
 from menu_app.models import Dish
 from menu_app.repositories.base_repository import BaseRepository
@@ -15,23 +16,50 @@ class DishRepository(BaseRepository):
     """Класс взаимодействия с базой данных для модели Dish с методами CRUD."""
 
     def __init__(self) -> None:
-        """Инициализация класса с указанием используемой модели."""
+        """Инициализация класса с указанием используемой модели и заранее \
+        построенных запросов чтения."""
         self.model = Dish
+        self.list_query = (
+            select(
+                self.model.id,
+                self.model.title,
+                self.model.description,
+                func.round(self.model.current_price, 2).label('price')
+            )
+            .filter(self.model.submenu_id == bindparam('submenu_id'))
+        )
+        self.page_queries = self.build_page_queries(self.list_query)
+        self.get_query = (
+            select(
+                self.model.id,
+                self.model.title,
+                self.model.description,
+                func.round(self.model.current_price, 2).label('price')
+            )
+            .filter(self.model.id == bindparam('dish_id'))
+        )
 
-    async def get_list(self, db: AsyncSession) -> Sequence:
+    async def get_list(
+            self,
+            db: AsyncSession,
+            submenu_id: UUID,
+            limit: int | None = None,
+            after: UUID | None = None
+    ) -> Sequence | dict:
         """
         Метод получения списка блюд.
 
         :param db: Экземпляром сеанса базы данных.
-        :return: Список блюд.
+        :param submenu_id: Идентификатор под-меню.
+        :param limit: Размер страницы, без него возвращается весь список.
+        :param after: Курсор - идентификатор последней строки предыдущей \
+        страницы.
+        :return: Список блюд или его страница.
         """
-        query = select(
-            self.model.id,
-            self.model.title,
-            self.model.description,
-            func.round(self.model.current_price, 2).label('price')
-        )
-        result = await db.stream(query)
+        params = {'submenu_id': submenu_id}
+        if limit is not None:
+            return await self.get_page(db, params, limit, after)
+        result = await db.stream(self.list_query, params)
         curr = await result.mappings().all()
         return curr
 
@@ -43,16 +71,10 @@ class DishRepository(BaseRepository):
         :param dish_id: идентификатор блюда.
         :return: Блюдо с указанным идентификатором.
         """
-        query = (
-            select(
-                self.model.id,
-                self.model.title,
-                self.model.description,
-                func.round(self.model.current_price, 2).label('price')
-            )
-            .filter(self.model.id == dish_id)
+        result = await db.stream(
+            self.get_query,
+            {'dish_id': dish_id}
         )
-        result = await db.stream(query)
         curr = await result.mappings().first()
         if curr:
             return curr
@@ -83,12 +105,70 @@ class DishRepository(BaseRepository):
         await self.data_commit(db, dish)
         return dish
 
+    async def bulk_upsert(
+            self,
+            db: AsyncSession,
+            data: list[DishCreate],
+            submenu_id: UUID
+    ) -> list[RowMapping]:
+        """
+        Метод создает блюда под-меню одним многострочным запросом INSERT ... \
+        ON CONFLICT. Блюда, название которых уже есть в этом под-меню, \
+        обновляются. Если название занято блюдом другого под-меню, изменения \
+        отменяются с ошибкой 409.
+
+        :param db: Экземпляром сеанса базы данных.
+        :param data: Данные блюд с уникальными названиями.
+        :param submenu_id: Идентификатор под-меню, которому относятся блюда.
+        :return: Информация о созданных и обновленных блюдах.
+        """
+        values: Insert = insert(self.model).values([
+            {
+                'id': uuid4(),
+                'title': item.title,
+                'description': item.description,
+                'price': item.price,
+                'discount': 0,
+                'submenu_id': submenu_id
+            }
+            for item in data
+        ])
+        upsert: Insert = values.on_conflict_do_update(
+            index_elements=[self.model.title],
+            set_={
+                'description': values.excluded.description,
+                'price': values.excluded.price
+            },
+            where=self.model.submenu_id == values.excluded.submenu_id
+        )
+        query = upsert.returning(
+            self.model.id,
+            self.model.title,
+            self.model.description,
+            func.round(self.model.current_price, 2).label('price')
+        )
+        try:
+            result = await db.execute(query)
+            rows = list(result.mappings().all())
+            if len(rows) < len(data):
+                await db.rollback()
+                raise HTTPException(
+                    status_code=409,
+                    detail='dish title belongs to another submenu'
+                )
+            await db.commit()
+        except SQLAlchemyError as e:
+            error = str(e.__cause__)
+            await db.rollback()
+            raise RuntimeError(error) from e
+        return rows
+
     async def update(
             self,
             db: AsyncSession,
             data: DishCreate,
             dish_id: UUID
-    ) -> Dish:
+    ) -> RowMapping:
         """
         Метод обновления информации о существующем блюде.
 
@@ -98,42 +178,37 @@ class DishRepository(BaseRepository):
         :return: Обновленная информация о блюде.
         """
         query = (
-            select(self.model)
+            update(self.model)
             .filter(self.model.id == dish_id)
+            .values(
+                title=data.title,
+                description=data.description,
+                price=data.price
+            )
+            .returning(
+                self.model.id,
+                self.model.title,
+                self.model.description,
+                func.round(self.model.current_price, 2).label('price')
+            )
         )
-        result = await db.stream(query)
-        dish = await result.scalars().first()
-        dish.title = data.title
-        dish.description = data.description
-        dish.price = data.price
-        await self.data_commit(db, dish)
-        return dish
+        return await self.returning_commit(db, query, 'dish not found')
 
-    async def remove(self, db: AsyncSession, dish_id: UUID) -> JSONResponse:
+    async def remove(self, db: AsyncSession, dish_id: UUID) -> RowMapping:
         """
-        Метод удаляет блюдо из базы данных.
+        Метод удаляет блюдо из базы данных одним запросом DELETE ... \
+        RETURNING.
 
         :param db: Экземпляром сеанса базы данных.
         :param dish_id: Идентификатор блюда.
-        :return: JSONResponse об успехе или неудачи удаления.
+        :return: Идентификатор удаленного блюда.
         """
-        try:
-            query = delete(self.model).filter(self.model.id == dish_id)
-            await db.stream(query)
-            await db.commit()
-            return JSONResponse(
-                status_code=200,
-                content={
-                    'message': 'The dish has been deleted'
-                }
-            )
-        except Exception as e:
-            return JSONResponse(
-                status_code=404,
-                content={
-                    'message': e
-                }
-            )
+        query = (
+            delete(self.model)
+            .filter(self.model.id == dish_id)
+            .returning(self.model.id)
+        )
+        return await self.returning_commit(db, query, 'dish not found')
 
 
 repository: DishRepository = DishRepository()
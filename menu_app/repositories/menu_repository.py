@@ -2,10 +2,8 @@
 from uuid import UUID, uuid4
 
 from fastapi import HTTPException
-from sqlalchemy import RowMapping, Sequence, delete, func, select
+from sqlalchemy import RowMapping, Sequence, bindparam, delete, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.sql.functions import coalesce
-from starlette.responses import JSONResponse
 
 from menu_app.models import Menu, Submenu
 from menu_app.repositories.base_repository import BaseRepository
@@ -16,42 +14,47 @@ class MenuRepository(BaseRepository):
     """Класс взаимодействия с базой данных для модели Menu с методами CRUD."""
 
     def __init__(self):
-        """Инициализация класса с указанием используемой модели."""
+        """Инициализация класса с указанием используемой модели и заранее \
+        построенных запросов чтения."""
         self.model = Menu
-
-    async def get_list(self, db: AsyncSession) -> Sequence:
-        """
-        Метод получения списка меню.
-
-        :param db: Экземпляром сеанса базы данных.
-        :return: Список меню.
-        """
-        subquery = (
-            select(
-                Submenu.menu_id,
-                Submenu.id.label('submenu_id'),
-                func.count(Submenu.dishes).label('dishes_count')
-            )
-            .outerjoin(Submenu.dishes)
-            .group_by(Submenu.id)
-            .subquery('subquery')
+        self.list_query = select(
+            self.model.id,
+            self.model.title,
+            self.model.description,
+            self.model.submenus_count,
+            self.model.dishes_count
         )
-        query = (
+        self.page_queries = self.build_page_queries(self.list_query)
+        self.get_query = (
             select(
                 self.model.id,
                 self.model.title,
                 self.model.description,
-                func.count(subquery.c.submenu_id).label('submenus_count'),
-                func.sum(
-                    coalesce(subquery.c.dishes_count, 0)
-                ).label('dishes_count')
-            )
-            .outerjoin(
-                subquery, self.model.id == subquery.c.menu_id
+                self.model.submenus_count,
+                self.model.dishes_count
             )
-            .group_by(self.model.id)
+            .filter(self.model.id == bindparam('menu_id'))
         )
-        result = await db.stream(query)
+
+    async def get_list(
+            self,
+            db: AsyncSession,
+            limit: int | None = None,
+            after: UUID | None = None
+    ) -> Sequence | dict:
+        """
+        Метод получения списка меню. Количество под-меню и блюд хранится в \
+        самой таблице меню и поддерживается триггерами.
+
+        :param db: Экземпляром сеанса базы данных.
+        :param limit: Размер страницы, без него возвращается весь список.
+        :param after: Курсор - идентификатор последней строки предыдущей \
+        страницы.
+        :return: Список меню или его страница.
+        """
+        if limit is not None:
+            return await self.get_page(db, {}, limit, after)
+        result = await db.stream(self.list_query)
         curr = await result.mappings().all()
         return curr
 
@@ -63,34 +66,10 @@ class MenuRepository(BaseRepository):
         :param menu_id: Идентификатор меню.
         :return: Меню с указанным идентификатором.
         """
-        subquery = (
-            select(
-                Submenu.menu_id,
-                Submenu.id.label('submenu_id'),
-                func.count(Submenu.dishes).label('dishes_count')
-            )
-            .outerjoin(Submenu.dishes)
-            .filter(Submenu.menu_id == menu_id)
-            .group_by(Submenu.menu_id, Submenu.id)
-            .subquery('subquery')
-        )
-        query = (
-            select(
-                self.model.id,
-                self.model.title,
-                self.model.description,
-                func.count(subquery.c.submenu_id).label('submenus_count'),
-                func.sum(
-                    coalesce(subquery.c.dishes_count, 0)
-                ).label('dishes_count')
-            )
-            .outerjoin(
-                subquery, self.model.id == subquery.c.menu_id
-            )
-            .filter(self.model.id == menu_id)
-            .group_by(self.model.id)
+        result = await db.stream(
+            self.get_query,
+            {'menu_id': menu_id}
         )
-        result = await db.stream(query)
         curr = await result.mappings().first()
         if curr:
             return curr
@@ -117,7 +96,7 @@ class MenuRepository(BaseRepository):
             db: AsyncSession,
             data: MenuCreate,
             menu_id: UUID
-    ) -> Menu:
+    ) -> RowMapping:
         """
         Метод обновления информации о существующем меню.
 
@@ -127,43 +106,46 @@ class MenuRepository(BaseRepository):
         :return: Обновленная информация о меню.
         """
         query = (
-            select(self.model)
+            update(self.model)
             .filter(self.model.id == menu_id)
+            .values(
+                title=data.title,
+                description=data.description
+            )
+            .returning(
+                self.model.id,
+                self.model.title,
+                self.model.description,
+                self.model.submenus_count,
+                self.model.dishes_count
+            )
         )
-        result = await db.stream(query)
-        menu = await result.scalars().first()
-        menu.title = data.title
-        menu.description = data.description
-        await self.data_commit(db, menu)
-        return menu
+        return await self.returning_commit(db, query, 'menu not found')
 
-    async def remove(
-            self,
-            db: AsyncSession,
-            menu_id: UUID
-    ) -> JSONResponse | HTTPException:
+    async def remove(self, db: AsyncSession, menu_id: UUID) -> RowMapping:
         """
-        Метод удаляет меню из базы данных.
+        Метод удаляет меню из базы данных одним запросом DELETE ... \
+        RETURNING. Вместе с идентификатором меню возвращается список \
+        идентификаторов под-меню, удаляемых каскадно, - запрос видит их \
+        в снимке данных до удаления.
 
         :param db: Экземпляром сеанса базы данных.
         :param menu_id: Идентификатор меню.
-        :return: JSONResponse об успехе или неудачи удаления.
+        :return: Идентификаторы удаленного меню и его под-меню.
         """
-        try:
-            query = delete(self.model).filter(self.model.id == menu_id)
-            await db.stream(query)
-            await db.commit()
-            return JSONResponse(
-                status_code=200,
-                content={
-                    'message': 'The menu has been deleted'
-                }
-            )
-        except Exception as e:
-            return HTTPException(
-                status_code=404,
-                detail=e
-            )
+        deleted = (
+            delete(self.model)
+            .filter(self.model.id == menu_id)
+            .returning(self.model.id)
+            .cte('deleted_menu')
+        )
+        submenus = (
+            select(func.array_agg(Submenu.id))
+            .filter(Submenu.menu_id == deleted.c.id)
+            .scalar_subquery()
+        )
+        query = select(deleted.c.id, submenus.label('submenus'))
+        return await self.returning_commit(db, query, 'menu not found')
 
 
 repository = MenuRepository()
@@ -3,9 +3,8 @@ CRUD."""
 from uuid import UUID, uuid4
 
 from fastapi import HTTPException
-from sqlalchemy import RowMapping, Sequence, delete, func, select
+from sqlalchemy import RowMapping, Sequence, bindparam, delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from starlette.responses import JSONResponse
 
 from menu_app.models import Submenu
 from menu_app.repositories.base_repository import BaseRepository
@@ -17,27 +16,51 @@ class SubmenuRepository(BaseRepository):
     CRUD."""
 
     def __init__(self):
-        """Инициализация класса с указанием используемой модели."""
+        """Инициализация класса с указанием используемой модели и заранее \
+        построенных запросов чтения."""
         self.model = Submenu
-
-    async def get_list(self, db: AsyncSession) -> Sequence:
-        """
-        Метод получения списка под-меню.
-
-        :param db: Экземпляром сеанса базы данных.
-        :return: Список под-меню.
-        """
-        query = (
+        self.list_query = (
+            select(
+                self.model.id,
+                self.model.title,
+                self.model.description,
+                self.model.dishes_count
+            )
+            .filter(self.model.menu_id == bindparam('menu_id'))
+        )
+        self.page_queries = self.build_page_queries(self.list_query)
+        self.get_query = (
             select(
                 self.model.id,
                 self.model.title,
                 self.model.description,
-                func.count(self.model.dishes).label('dishes_count')
+                self.model.dishes_count
             )
-            .outerjoin(self.model.dishes)
-            .group_by(self.model.id)
+            .filter(self.model.id == bindparam('submenu_id'))
         )
-        result = await db.stream(query)
+
+    async def get_list(
+            self,
+            db: AsyncSession,
+            menu_id: UUID,
+            limit: int | None = None,
+            after: UUID | None = None
+    ) -> Sequence | dict:
+        """
+        Метод получения списка под-меню. Количество блюд хранится в самой \
+        таблице под-меню и поддерживается триггерами.
+
+        :param db: Экземпляром сеанса базы данных.
+        :param menu_id: Идентификатор меню.
+        :param limit: Размер страницы, без него возвращается весь список.
+        :param after: Курсор - идентификатор последней строки предыдущей \
+        страницы.
+        :return: Список под-меню или его страница.
+        """
+        params = {'menu_id': menu_id}
+        if limit is not None:
+            return await self.get_page(db, params, limit, after)
+        result = await db.stream(self.list_query, params)
         curr = await result.mappings().all()
         return curr
 
@@ -49,18 +72,10 @@ class SubmenuRepository(BaseRepository):
         :param submenu_id: Идентификатор под-меню.
         :return: Подменю с указанным идентификатором.
         """
-        query = (
-            select(
-                self.model.id,
-                self.model.title,
-                self.model.description,
-                func.count(self.model.dishes).label('dishes_count')
-            )
-            .outerjoin(self.model.dishes)
-            .filter(self.model.id == submenu_id)
-            .group_by(self.model.id)
+        result = await db.stream(
+            self.get_query,
+            {'submenu_id': submenu_id}
         )
-        result = await db.stream(query)
         curr = await result.mappings().first()
         if curr:
             return curr
@@ -94,7 +109,7 @@ class SubmenuRepository(BaseRepository):
             db: AsyncSession,
             data: SubmenuCreate,
             submenu_id: UUID
-    ) -> Submenu:
+    ) -> RowMapping:
         """
         Метод обновления информации о существующем под-меню.
 
@@ -104,41 +119,36 @@ class SubmenuRepository(BaseRepository):
         :return: Обновленная информация под-меню.
         """
         query = (
-            select(self.model)
+            update(self.model)
             .filter(self.model.id == submenu_id)
+            .values(
+                title=data.title,
+                description=data.description
+            )
+            .returning(
+                self.model.id,
+                self.model.title,
+                self.model.description,
+                self.model.dishes_count
+            )
         )
-        result = await db.stream(query)
-        submenu = await result.scalars().first()
-        submenu.title = data.title
-        submenu.description = data.description
-        await self.data_commit(db, submenu)
-        return submenu
+        return await self.returning_commit(db, query, 'submenu not found')
 
-    async def remove(self, db: AsyncSession, submenu_id: UUID) -> JSONResponse:
+    async def remove(self, db: AsyncSession, submenu_id: UUID) -> RowMapping:
         """
-        Метод удаляет под-меню из базы данных.
+        Метод удаляет под-меню из базы данных одним запросом DELETE ... \
+        RETURNING.
 
         :param db: Экземпляром сеанса базы данных.
         :param submenu_id: Идентификатор под-меню.
-        :return: JSONResponse об успехе или неудачи удаления.
+        :return: Идентификатор удаленного под-меню.
         """
-        try:
-            query = delete(self.model).filter(self.model.id == submenu_id)
-            await db.stream(query)
-            await db.commit()
-            return JSONResponse(
-                status_code=200,
-                content={
-                    'message': 'The submenu has been deleted'
-                }
-            )
-        except Exception as e:
-            return JSONResponse(
-                status_code=404,
-                content={
-                    'message': e
-                }
-            )
+        query = (
+            delete(self.model)
+            .filter(self.model.id == submenu_id)
+            .returning(self.model.id)
+        )
+        return await self.returning_commit(db, query, 'submenu not found')
 
 
 repository = SubmenuRepository()
@@ -1,10 +1,11 @@
 """Модуль для инициализации роутера, не связанного с моделями приложения.\
 Работает с сервисным слоем и слоем репозитория приложения."""
-from fastapi import APIRouter, Depends
-from sqlalchemy import Sequence
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.background import BackgroundTasks
+from starlette.responses import JSONResponse, Response
 
-from menu_app.database import get_db
+from menu_app.database import get_read_db
 from menu_app.schemas.app_schemas import AppBase
 from menu_app.services.app_service import service
 
@@ -22,11 +23,40 @@ routers = APIRouter(prefix='')
     name='full_menu',
     response_model=list[AppBase]
 )
-async def get_tree_menu(db: AsyncSession = Depends(get_db)) -> Sequence:
+async def get_tree_menu(
+        request: Request,
+        background_tasks: BackgroundTasks,
+        db: AsyncSession = Depends(get_read_db)
+) -> Response:
     """
     Функция работает с get-запросом получения данных из БД в виде дерева.
 
+    :param request: Запрос.
+    :param background_tasks: Фоновые задачи.
     :param db: Экземпляр сеанса базы данных.
     :return: Список меню со связанными подменю и блюдами в виде дерева.
     """
-    return await service.get_full_menu(db)
+    return service.get_response(
+        request,
+        await service.get_full_menu(db, background_tasks)
+    )
+
+
+@routers.get(
+    '/cache/stats/',
+    summary='Получаем статистику кэша',
+    description=(
+            'Количество попаданий и промахов, время заполнения, размер ответов'
+            ' и количество инвалидаций по семействам ключей кэша, общие для '
+            'всех процессов приложения.'
+    ),
+    tags=['app'],
+    name='cache_stats'
+)
+async def get_cache_stats() -> JSONResponse:
+    """
+    Функция возвращает статистику работы кэша приложения.
+
+    :return: Статистика кэша по семействам ключей.
+    """
+    return JSONResponse(await service.get_cache_stats())
@@ -1,14 +1,15 @@
 """Модуль с роутером для модели Dish."""
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Request
-from sqlalchemy import RowMapping, Sequence
+from fastapi import APIRouter, Body, Depends, Query, Request
+from sqlalchemy import RowMapping
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.background import BackgroundTasks
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 
-from menu_app.database import get_db
-from menu_app.schemas.dish_schemas import Dish, DishCreate
+from menu_app.config import config
+from menu_app.database import get_db, get_read_db
+from menu_app.schemas.dish_schemas import Dish, DishCreate, DishPage
 from menu_app.services.dish_service import service
 
 routers = APIRouter(prefix='/{submenu_id}/dishes')
@@ -20,25 +21,45 @@ routers = APIRouter(prefix='/{submenu_id}/dishes')
     name='get_list_dish',
     summary='Получаем список блюд',
     description=(
-            'В ответе вернутся все экземпляры модели Блюда в виде списка, '
-            'находящиеся в базе данных или пустой список, если не создавалось '
-            'ни одного экземпляра.'
+            'В ответе вернутся все экземпляры модели Блюда, относящиеся к '
+            'указанному под-меню, в виде списка или пустой список, если в '
+            'под-меню не создавалось ни одного экземпляра.'
+            ' При переданном limit вернется страница списка, упорядоченного '
+            'по id, и курсор next для запроса следующей страницы в after.'
     ),
-    response_model=list[Dish]
+    response_model=list[Dish] | DishPage
 )
 async def get_list(
         request: Request,
-        db: AsyncSession = Depends(get_db)
-) -> Sequence:
+        submenu_id: UUID,
+        background_tasks: BackgroundTasks,
+        limit: int | None = Query(None, ge=1, le=config.PAGE_MAX_LIMIT),
+        after: UUID | None = None,
+        db: AsyncSession = Depends(get_read_db)
+) -> Response:
     """
     Функция получает из слоя service информацию о списке блюд и передает ее в\
     качестве ответа на get-запрос.
 
     :param db: Экземпляром сеанса базы данных.
+    :param submenu_id: Идентификатор под-меню.
     :param request: Запрос.
+    :param background_tasks: Фоновые задачи.
+    :param limit: Размер страницы, без него возвращается весь список.
+    :param after: Курсор из поля next предыдущей страницы.
     :return: Список блюд.
     """
-    return await service.get_list(db, request.path_params)
+    return service.get_response(
+        request,
+        await service.get_list(
+            db,
+            submenu_id,
+            request.path_params,
+            background_tasks,
+            limit,
+            after
+        )
+    )
 
 
 @routers.get(
@@ -52,8 +73,9 @@ async def get_list(
 async def get(
         request: Request,
         dish_id: UUID,
-        db: AsyncSession = Depends(get_db)
-) -> RowMapping:
+        background_tasks: BackgroundTasks,
+        db: AsyncSession = Depends(get_read_db)
+) -> Response:
     """
     Функция получает из слоя service информацию о конкретном блюде и передает\
     ее качестве ответа на get-запрос.
@@ -61,9 +83,13 @@ async def get(
     :param db: Экземпляром сеанса базы данных.
     :param dish_id: Идентификатор блюда.
     :param request: Запрос.
+    :param background_tasks: Фоновые задачи.
     :return: Информация о блюде с указанным идентификатором.
     """
-    return await service.get(db, dish_id, request.path_params)
+    return service.get_response(
+        request,
+        await service.get(db, dish_id, request.path_params, background_tasks)
+    )
 
 
 @routers.post(
@@ -106,6 +132,51 @@ async def create(
     )
 
 
+@routers.post(
+    '/bulk/',
+    status_code=201,
+    summary='Создаем блюда списком',
+    description=(
+            'Необходимо передать список блюд с названием, описанием и ценой. '
+            'Блюда создаются одним запросом, а блюда под-меню с совпадающим '
+            'названием обновляются. Если название занято блюдом другого '
+            'под-меню, ни одно блюдо не сохраняется и возвращается ошибка 409,'
+            ' а если названия в списке повторяются - ошибка 422.'
+            ' В ответе вернется информация о созданных и обновленных блюдах.'
+    ),
+    tags=['dishes'],
+    name='bulk_create_dish',
+    response_model=list[Dish]
+)
+async def bulk_create(
+        request: Request,
+        submenu_id: UUID,
+        background_tasks: BackgroundTasks,
+        data: list[DishCreate] = Body(
+            min_length=1,
+            max_length=config.DISH_BULK_MAX_ITEMS
+        ),
+        db: AsyncSession = Depends(get_db)
+) -> list[RowMapping]:
+    """
+    Функция создает или обновляет блюда под-меню списком.
+
+    :param submenu_id: Идентификатор под-меню, к которому относятся блюда.
+    :param request: Запрос.
+    :param background_tasks: Фоновые задачи.
+    :param data: Список данных блюд.
+    :param db: Экземпляром сеанса базы данных.
+    :return: Информация о созданных и обновленных блюдах.
+    """
+    return await service.bulk_create(
+        db,
+        data,
+        submenu_id,
+        request.path_params,
+        background_tasks
+    )
+
+
 @routers.patch(
     '/{dish_id}/',
     summary='Обновляем блюдо',
@@ -123,7 +194,7 @@ async def update(
         data: DishCreate,
         background_tasks: BackgroundTasks,
         db: AsyncSession = Depends(get_db)
-) -> Dish:
+) -> RowMapping:
     """
     Функция обновляет информацию о созданном блюде, передавая информацию через\
     слой service в слой repository, после чего возвращает ответ пользователю.
@@ -1,14 +1,15 @@
 """Модуль с роутером для модели Menu."""
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Request
-from sqlalchemy import RowMapping, Sequence
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy import RowMapping
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.background import BackgroundTasks
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 
-from menu_app.database import get_db
-from menu_app.schemas.menu_schemas import Menu, MenuCreate
+from menu_app.config import config
+from menu_app.database import get_db, get_read_db
+from menu_app.schemas.menu_schemas import Menu, MenuCreate, MenuPage
 from menu_app.services.menu_service import service
 
 routers = APIRouter(prefix='/menus')
@@ -21,20 +22,35 @@ routers = APIRouter(prefix='/menus')
             'В ответе вернутся все экземпляры модели Меню в виде списка, '
             'находящиеся в базе данных или пустой список, если не создавалось '
             'ни одного экземпляра.'
+            ' При переданном limit вернется страница списка, упорядоченного '
+            'по id, и курсор next для запроса следующей страницы в after.'
     ),
     tags=['menus'],
-    response_model=list[Menu],
+    response_model=list[Menu] | MenuPage,
     name='get_list_menu'
 )
-async def get_list(db: AsyncSession = Depends(get_db)) -> Sequence:
+async def get_list(
+        request: Request,
+        background_tasks: BackgroundTasks,
+        limit: int | None = Query(None, ge=1, le=config.PAGE_MAX_LIMIT),
+        after: UUID | None = None,
+        db: AsyncSession = Depends(get_read_db)
+) -> Response:
     """
     Функция получает из слоя service информацию о списке меню и передает ее в\
     качестве ответа на get-запрос.
 
+    :param request: Запрос.
+    :param background_tasks: Фоновые задачи.
+    :param limit: Размер страницы, без него возвращается весь список.
+    :param after: Курсор из поля next предыдущей страницы.
     :param db: Экземпляром сеанса базы данных.
     :return: Список меню.
     """
-    return await service.get_list(db)
+    return service.get_response(
+        request,
+        await service.get_list(db, background_tasks, limit, after)
+    )
 
 
 @routers.get(
@@ -48,8 +64,9 @@ async def get_list(db: AsyncSession = Depends(get_db)) -> Sequence:
 async def get(
         request: Request,
         menu_id: UUID,
-        db: AsyncSession = Depends(get_db)
-) -> RowMapping:
+        background_tasks: BackgroundTasks,
+        db: AsyncSession = Depends(get_read_db)
+) -> Response:
     """
     Функция получает из слоя service информацию о конкретном меню и передает\
     ее качестве ответа на get-запрос.
@@ -57,9 +74,13 @@ async def get(
     :param db: Экземпляром сеанса базы данных.
     :param menu_id: Идентификатор меню.
     :param request: Запрос.
+    :param background_tasks: Фоновые задачи.
     :return: Информация о меню с указанным идентификатором.
     """
-    return await service.get(db, menu_id, request.path_params)
+    return service.get_response(
+        request,
+        await service.get(db, menu_id, request.path_params, background_tasks)
+    )
 
 
 @routers.post(
@@ -108,7 +129,7 @@ async def update(
         data: MenuCreate,
         background_tasks: BackgroundTasks,
         db: AsyncSession = Depends(get_db)
-) -> Menu:
+) -> RowMapping:
     """
     Функция обновляет информацию о созданном меню, передавая информацию через\
     слой service в слой repository, после чего возвращает ответ пользователю.
@@ -1,14 +1,15 @@
 """Модуль с роутером для модели Submenu."""
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Request
-from sqlalchemy import RowMapping, Sequence
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy import RowMapping
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.background import BackgroundTasks
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 
-from menu_app.database import get_db
-from menu_app.schemas.submenu_schemas import Submenu, SubmenuCreate
+from menu_app.config import config
+from menu_app.database import get_db, get_read_db
+from menu_app.schemas.submenu_schemas import Submenu, SubmenuCreate, SubmenuPage
 from menu_app.services.submenu_service import service
 
 routers = APIRouter(prefix='/{menu_id}/submenus')
@@ -18,27 +19,47 @@ routers = APIRouter(prefix='/{menu_id}/submenus')
     '/',
     summary='Получаем список под-меню',
     description=(
-            'В ответе вернутся все экземпляры модели Подменю, находящиеся в '
-            'базе данных в виде списка или пустой список, если не создавалось '
-            'ни одного экземпляра.'
+            'В ответе вернутся все экземпляры модели Подменю, относящиеся к '
+            'указанному меню, в виде списка или пустой список, если в меню не '
+            'создавалось ни одного экземпляра.'
+            ' При переданном limit вернется страница списка, упорядоченного '
+            'по id, и курсор next для запроса следующей страницы в after.'
     ),
     tags=['submenus'],
     name='get_list_submenu',
-    response_model=list[Submenu]
+    response_model=list[Submenu] | SubmenuPage
 )
 async def get_list(
         request: Request,
-        db: AsyncSession = Depends(get_db)
-) -> Sequence:
+        menu_id: UUID,
+        background_tasks: BackgroundTasks,
+        limit: int | None = Query(None, ge=1, le=config.PAGE_MAX_LIMIT),
+        after: UUID | None = None,
+        db: AsyncSession = Depends(get_read_db)
+) -> Response:
     """
     Функция получает из слоя service информацию о списке под-меню и передает \
     ее в качестве ответа на get-запрос.
 
     :param db: Экземпляром сеанса базы данных.
+    :param menu_id: Идентификатор меню.
     :param request: Запрос.
+    :param background_tasks: Фоновые задачи.
+    :param limit: Размер страницы, без него возвращается весь список.
+    :param after: Курсор из поля next предыдущей страницы.
     :return: Список под-меню.
     """
-    return await service.get_list(db, request.path_params)
+    return service.get_response(
+        request,
+        await service.get_list(
+            db,
+            menu_id,
+            request.path_params,
+            background_tasks,
+            limit,
+            after
+        )
+    )
 
 
 @routers.get(
@@ -52,8 +73,9 @@ async def get_list(
 async def get(
         request: Request,
         submenu_id: UUID,
-        db: AsyncSession = Depends(get_db)
-) -> RowMapping:
+        background_tasks: BackgroundTasks,
+        db: AsyncSession = Depends(get_read_db)
+) -> Response:
     """
     Функция получает из слоя service информацию о конкретном под-меню и\
     передает ее качестве ответа на get-запрос.
@@ -61,9 +83,18 @@ async def get(
     :param db: Экземпляром сеанса базы данных.
     :param submenu_id: Идентификатор под-меню.
     :param request: Запрос.
+    :param background_tasks: Фоновые задачи.
     :return: Информация о под-меню с указанным идентификатором.
     """
-    return await service.get(db, submenu_id, request.path_params)
+    return service.get_response(
+        request,
+        await service.get(
+            db,
+            submenu_id,
+            request.path_params,
+            background_tasks
+        )
+    )
 
 
 @routers.post(
@@ -123,7 +154,7 @@ async def update(
         submenu_id: UUID,
         background_tasks: BackgroundTasks,
         db: AsyncSession = Depends(get_db)
-) -> Submenu:
+) -> RowMapping:
     """
     Функция обновляет информацию о созданном под-меню, передавая информацию\
     через слой service в слой repository, после чего возвращает ответ\
@@ -22,3 +22,10 @@ class Dish(DishBase):
     """Модель данных для вывода информации о блюде в ответе пользователю."""
 
     id: UUID4
+
+
+class DishPage(BaseModel):
+    """Модель данных страницы списка блюд с курсором следующей страницы."""
+
+    items: list[Dish]
+    next: UUID4 | None = None
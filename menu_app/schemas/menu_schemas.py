@@ -21,3 +21,10 @@ class Menu(MenuBase):
     id: UUID4
     submenus_count: int | None = 0
     dishes_count: int | None = 0
+
+
+class MenuPage(BaseModel):
+    """Модель данных страницы списка меню с курсором следующей страницы."""
+
+    items: list[Menu]
+    next: UUID4 | None = None
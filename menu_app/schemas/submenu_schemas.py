@@ -20,3 +20,10 @@ class Submenu(SubmenuBase):
 
     id: UUID4
     dishes_count: int | None = 0
+
+
+class SubmenuPage(BaseModel):
+    """Модель данных страницы списка под-меню с курсором следующей страницы."""
+
+    items: list[Submenu]
+    next: UUID4 | None = None
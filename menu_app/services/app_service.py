@@ -1,29 +1,166 @@
 """Сервисный слой приложения, не связанного с конкретной моделью приложения."""
-from sqlalchemy import Sequence
+import asyncio
+import json
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from aioredis.exceptions import LockError
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.background import BackgroundTasks
 
+from menu_app.config import config
+from menu_app.database import async_session
 from menu_app.repositories.app_repository import get_tree_menu_repository
-from menu_app.services.base_service import BaseService
+from menu_app.services.base_service import BaseService, cache_stats
+from menu_app.services.dish_service import service as dish_service
+from menu_app.services.menu_service import service as menu_service
+from menu_app.services.submenu_service import service as submenu_service
 
 
 class AppService(BaseService):
     """Класс сервисных методов приложения, не связанных с конкретной \
     моделью."""
 
-    async def get_full_menu(self, db: AsyncSession) -> Sequence:
+    def __init__(self) -> None:
+        """Инициализация класса со временем блокировки прогрева кэша."""
+        super().__init__()
+        self.warm_up_lifetime = 60
+
+    async def get_full_menu(
+            self,
+            db: AsyncSession,
+            background_tasks: BackgroundTasks
+    ) -> bytes:
         """
         Метод обрабатывает запрос на получения всех данных из БД в виде \
-        дерева JSON. Проверяет наличие кэша и, при его отсутствии, запишет кэш.
+        дерева JSON. Проверяет наличие кэша и, при его отсутствии, запишет \
+        кэш. Документ собирается базой данных и кэшируется без повторной \
+        сериализации.
 
         :param db: Экземпляр сеанса базы данных.
-        :return: Древовидное меню со всеми элементами БД.
-        """
-        cache = await self.get_cache(self.full_menu)
-        if cache:
-            return cache
-        result = await get_tree_menu_repository(db)
-        await self.set_cache(self.full_menu, result)
-        return result
+        :param background_tasks: Фоновые задачи.
+        :return: Древовидное меню со всеми элементами БД в формате JSON.
+        """
+        return await self.get_or_set_cache(
+            self.full_menu,
+            {},
+            None,
+            lambda: get_tree_menu_repository(db),
+            background_tasks
+        )
+
+    async def get_cache_stats(self) -> dict:
+        """
+        Метод возвращает статистику работы кэша всех процессов приложения.
+
+        :return: Словарь статистики по семействам ключей.
+        """
+        return await cache_stats.get_stats(set(self.families.values()))
+
+    async def warm_up(self) -> None:
+        """
+        Метод прогревает кэш: перезаписывает древовидное меню, список меню, \
+        а также экземпляр и список под-меню каждого меню и экземпляр и список\
+        блюд каждого под-меню. Запросы к базе данных выполняются не более \
+        чем по CACHE_WARM_UP_CONCURRENCY одновременно, каждый в своем сеансе.\
+        Прогрев выполняется одним процессом, остальные его пропускают.
+
+        :return: None.
+        """
+        lock = self.redis.lock('lock.warm_up', timeout=self.warm_up_lifetime)
+        if not await lock.acquire(blocking=False):
+            return
+        try:
+            async with async_session() as db:
+                tree = self.render(None, await get_tree_menu_repository(db))
+            await self.set_cache(
+                await self.get_key(self.full_menu, {}),
+                self.get_etag(tree) + tree,
+                self.get_lifetime(self.full_menu)
+            )
+            jobs: list[tuple] = [(
+                self.get_list_menu,
+                {},
+                menu_service.list_schema,
+                menu_service.repository.get_list
+            )]
+            for menu in json.loads(tree):
+                s = await self.get_lazy_s({'menu_id': menu['id']})
+                jobs.append((
+                    self.get_menu,
+                    s,
+                    menu_service.schema,
+                    lambda db, s=s: menu_service.repository.get(
+                        db, s['menu_id']
+                    )
+                ))
+                jobs.append((
+                    self.get_list_submenu,
+                    s,
+                    submenu_service.list_schema,
+                    lambda db, s=s: submenu_service.repository.get_list(
+                        db, s['menu_id']
+                    )
+                ))
+                for submenu in menu['submenus'] or []:
+                    s = await self.get_lazy_s(
+                        {'menu_id': menu['id'], 'submenu_id': submenu['id']}
+                    )
+                    jobs.append((
+                        self.get_submenu,
+                        s,
+                        submenu_service.schema,
+                        lambda db, s=s: submenu_service.repository.get(
+                            db, s['submenu_id']
+                        )
+                    ))
+                    jobs.append((
+                        self.get_list_dish,
+                        s,
+                        dish_service.list_schema,
+                        lambda db, s=s: dish_service.repository.get_list(
+                            db, s['submenu_id']
+                        )
+                    ))
+            semaphore = asyncio.Semaphore(config.CACHE_WARM_UP_CONCURRENCY)
+            await asyncio.gather(
+                *(self.warm_up_cache(semaphore, *job) for job in jobs)
+            )
+        finally:
+            try:
+                await lock.release()
+            except LockError:
+                pass
+
+    async def warm_up_cache(
+            self,
+            semaphore: asyncio.Semaphore,
+            template: str,
+            s: dict,
+            schema: TypeAdapter,
+            loader: Callable[[AsyncSession], Awaitable[Any]]
+    ) -> None:
+        """
+        Метод перезаписывает одну запись кэша результатом запроса к базе \
+        данных, ограничивая число одновременных запросов семафором.
+
+        :param semaphore: Семафор, ограничивающий число запросов к базе.
+        :param template: Шаблон ключа кэша.
+        :param s: Словарь с аргументами ленивой строки.
+        :param schema: Адаптер схемы ответа.
+        :param loader: Функция, выполняющая запрос в переданном сеансе.
+        :return: None.
+        """
+        async with semaphore:
+            request = await self.get_key(template, s)
+            async with async_session() as db:
+                await self.load_cache(
+                    request,
+                    template,
+                    schema,
+                    lambda: loader(db)
+                )
 
 
 service: AppService = AppService()
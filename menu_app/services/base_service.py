@@ -1,19 +1,374 @@
 """Модуль используется для инициализации методов кэширования в слое."""
-import pickle
+import asyncio
+import hashlib
+import json
+import random
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 import aioredis
+from aioredis.exceptions import LockError
+from fastapi import HTTPException
+from pydantic import TypeAdapter
+from starlette.background import BackgroundTasks
+from starlette.requests import Request
+from starlette.responses import Response
 
+from menu_app.cache import (
+    FLUSH_MESSAGE,
+    INVALIDATION_CHANNEL,
+    TAG_GLOBAL,
+    TAG_LIFETIME,
+    TAG_MENU,
+    TAG_SUBMENU,
+    WARM_UP_MESSAGE,
+    get_redis,
+)
 from menu_app.config import config
+from menu_app.database import hold_primary
+
+NOT_FOUND = b'!'
+ZLIB = b'\x01'
+ETAG_SIZE = 34
+
+
+class LocalCache:
+    """Кэш первого уровня внутри процесса с ограничением по количеству \
+    записей, их суммарному размеру и времени жизни. При переполнении \
+    вытесняются давно не использованные записи (LRU)."""
+
+    def __init__(self, max_items: int, max_bytes: int, ttl: float) -> None:
+        """
+        Инициализация пустого кэша с заданными ограничениями.
+
+        :param max_items: Максимальное количество записей, 0 отключает кэш.
+        :param max_bytes: Максимальный суммарный размер записей в байтах.
+        :param ttl: Время жизни записи в секундах.
+        """
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.size = 0
+        self._data: OrderedDict[str, tuple[float, int, Any]] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Свойство показывает, включен ли кэш первого уровня.
+
+        :return: Признак включенного кэша.
+        """
+        return self.max_items > 0 and self.ttl > 0
+
+    def get(self, key: str) -> Any:
+        """
+        Метод возвращает значение по ключу, если оно есть и не устарело.
+
+        :param key: Ключ записи.
+        :return: Значение записи или None.
+        """
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires, _, value = item
+        if expires < time.monotonic():
+            self.delete(key)
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, size: int) -> None:
+        """
+        Метод сохраняет значение и вытесняет старые записи при превышении \
+        ограничений. Слишком большие значения в кэш не попадают, но прежнее\
+        значение ключа удаляется всегда.
+
+        :param key: Ключ записи.
+        :param value: Сохраняемое значение.
+        :param size: Размер значения в байтах.
+        :return: None.
+        """
+        self.delete(key)
+        if not self.enabled or size > self.max_bytes:
+            return
+        self._data[key] = (time.monotonic() + self.ttl, size, value)
+        self.size += size
+        while len(self._data) > self.max_items or self.size > self.max_bytes:
+            _, (_, old_size, _) = self._data.popitem(last=False)
+            self.size -= old_size
+
+    def delete(self, *keys: str) -> None:
+        """
+        Метод удаляет записи с указанными ключами.
+
+        :param keys: Ключи записей.
+        :return: None.
+        """
+        for key in keys:
+            item = self._data.pop(key, None)
+            if item is not None:
+                self.size -= item[1]
+
+    def clear(self) -> None:
+        """
+        Метод удаляет все записи кэша.
+
+        :return: None.
+        """
+        self._data.clear()
+        self.size = 0
+
+    def get_stats(self) -> dict:
+        """
+        Метод возвращает текущий размер кэша.
+
+        :return: Количество записей и их суммарный размер в байтах.
+        """
+        return {'items': len(self._data), 'bytes': self.size}
+
+
+class CacheTTLPolicy:
+    """Политика времени свежести записей кэша: отдельные значения для \
+    древовидного меню, списков и экземпляров со случайным разбросом, чтобы \
+    записи, заполненные одновременно, не истекали одновременно."""
+
+    def __init__(
+            self,
+            tree: int,
+            lists: int,
+            details: int,
+            jitter: float
+    ) -> None:
+        """
+        Инициализация политики.
+
+        :param tree: Время свежести древовидного меню в секундах.
+        :param lists: Время свежести списков в секундах.
+        :param details: Время свежести экземпляров в секундах.
+        :param jitter: Доля случайного отклонения времени свежести.
+        """
+        self.tree = tree
+        self.lists = lists
+        self.details = details
+        self.jitter = jitter
+
+    def get(self, family: str) -> int:
+        """
+        Метод возвращает время свежести записи семейства ключей со \
+        случайным отклонением.
+
+        :param family: Семейство ключей.
+        :return: Время свежести в секундах, не меньше одной секунды.
+        """
+        if family == 'tree':
+            lifetime = self.tree
+        elif family.endswith('_list'):
+            lifetime = self.lists
+        else:
+            lifetime = self.details
+        jitter = random.uniform(-self.jitter, self.jitter)
+        return max(1, round(lifetime * (1 + jitter)))
+
+
+class CacheStats:
+    """Статистика работы кэша по семействам ключей, общая для всех процессов\
+    приложения: попадания, промахи, время заполнения, размер ответов и \
+    количество инвалидаций. Счетчики накапливаются в памяти процесса и \
+    периодически сбрасываются в хэши Redis по одному на семейство одним \
+    конвейером, не занимая соединение на каждый запрос. Ошибки Redis при \
+    сбросе статистики пропускаются."""
+
+    prefix = 'stats.'
+    counters = (
+        'hits',
+        'stale_hits',
+        'misses',
+        'fills',
+        'fill_seconds',
+        'fill_seconds_max',
+        'bytes',
+        'invalidations',
+    )
+    set_max = (
+        "if tonumber(ARGV[2]) > tonumber(redis.call('HGET', KEYS[1], "
+        "ARGV[1]) or '0') then redis.call('HSET', KEYS[1], ARGV[1], ARGV[2]) "
+        "end"
+    )
+
+    def __init__(self, interval: float) -> None:
+        """
+        Инициализация пустых несброшенных счетчиков процесса.
+
+        :param interval: Период сброса счетчиков в Redis в секундах.
+        """
+        self.interval = interval
+        self.pending: dict[str, dict[str, float]] = {}
+
+    def record(self, family: str, **counters: float) -> None:
+        """
+        Метод увеличивает несброшенные счетчики семейства ключей в памяти \
+        процесса. Для fill_seconds_max сохраняется наибольшее значение.
+
+        :param family: Семейство ключей.
+        :param counters: Приращения счетчиков.
+        :return: None.
+        """
+        pending = self.pending.setdefault(family, {})
+        for name, value in counters.items():
+            if name == 'fill_seconds_max':
+                pending[name] = max(pending.get(name, 0), value)
+            else:
+                pending[name] = pending.get(name, 0) + value
+
+    async def flush(self) -> None:
+        """
+        Метод сбрасывает накопленные счетчики всех семейств ключей в Redis \
+        одним конвейером. Счетчик fill_seconds_max обновляется, только если \
+        новое значение больше сохраненного.
+
+        :return: None.
+        """
+        pending, self.pending = self.pending, {}
+        if not pending:
+            return
+        try:
+            async with get_redis().pipeline(transaction=False) as pipe:
+                pipe.set(self.prefix + 'started', time.time(), nx=True)
+                for family, counters in pending.items():
+                    key = self.prefix + family
+                    for name, value in counters.items():
+                        if name == 'fill_seconds_max':
+                            pipe.eval(self.set_max, 1, key, name, value)
+                        elif isinstance(value, float):
+                            pipe.hincrbyfloat(key, name, value)
+                        elif value:
+                            pipe.hincrby(key, name, value)
+                await pipe.execute()
+        except aioredis.RedisError:
+            pass
+
+    async def run(self) -> None:
+        """
+        Метод сбрасывает счетчики в Redis каждые interval секунд до отмены\
+        задачи.
+
+        :return: None.
+        """
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.flush()
+
+    def hit(self, family: str, stale: bool) -> None:
+        """
+        Метод учитывает попадание в кэш.
+
+        :param family: Семейство ключей.
+        :param stale: Признак устаревшей записи.
+        :return: None.
+        """
+        self.record(family, hits=1, stale_hits=int(stale))
+
+    def miss(self, family: str, seconds: float, size: int) -> None:
+        """
+        Метод учитывает промах кэша и его заполнение результатом запроса к \
+        базе данных.
+
+        :param family: Семейство ключей.
+        :param seconds: Время заполнения в секундах.
+        :param size: Размер записи в байтах.
+        :return: None.
+        """
+        self.record(
+            family,
+            misses=1,
+            fills=1,
+            fill_seconds=seconds,
+            fill_seconds_max=seconds,
+            bytes=size
+        )
+
+    def invalidate(self, families: set[str]) -> None:
+        """
+        Метод учитывает инвалидацию семейств ключей.
+
+        :param families: Семейства ключей, записи которых инвалидированы.
+        :return: None.
+        """
+        for family in families:
+            self.record(family, invalidations=1)
+
+    async def get_stats(self, families: set[str]) -> dict:
+        """
+        Метод сбрасывает счетчики процесса в Redis и возвращает счетчики \
+        всех процессов вместе с производными показателями: долей попаданий,\
+        средним временем заполнения и средним размером записи.
+
+        :param families: Семейства ключей.
+        :return: Словарь статистики.
+        """
+        await self.flush()
+        names = sorted(families)
+        async with get_redis().pipeline(transaction=False) as pipe:
+            pipe.get(self.prefix + 'started')
+            for family in names:
+                pipe.hgetall(self.prefix + family)
+            started, *values = await pipe.execute()
+        result = {}
+        for family, value in zip(names, values):
+            stats: dict[str, float] = dict.fromkeys(self.counters, 0)
+            for name, number in value.items():
+                name = name.decode()
+                if name.startswith('fill_seconds'):
+                    stats[name] = float(number)
+                else:
+                    stats[name] = int(number)
+            requests = stats['hits'] + stats['misses']
+            fills = stats['fills'] or 1
+            result[family] = {
+                **stats,
+                'hit_rate': stats['hits'] / requests if requests else 0.0,
+                'fill_seconds_avg': stats['fill_seconds'] / fills,
+                'bytes_avg': stats['bytes'] / fills,
+            }
+        return {
+            'uptime_seconds': time.time() - float(started or time.time()),
+            'families': result,
+            'local_cache': local_cache.get_stats(),
+        }
+
+
+local_cache = LocalCache(
+    config.L1_CACHE_MAX_ITEMS,
+    config.L1_CACHE_MAX_BYTES,
+    config.L1_CACHE_TTL,
+)
+local_locks: dict[str, list] = {}
+cache_stats = CacheStats(config.CACHE_STATS_FLUSH_INTERVAL)
+ttl_policy = CacheTTLPolicy(
+    config.CACHE_TTL_TREE,
+    config.CACHE_TTL_LIST,
+    config.CACHE_TTL_DETAIL,
+    config.CACHE_TTL_JITTER
+)
 
 
 class BaseService:
     """Базовый класс сервисных операций."""
 
     def __init__(self):
-        """Инициализация базовых значений адреса redis и времени жизни кэша."""
-        self.url_redis = config.url_redis
-        self.cache_lifetime = 15
+        """
+        Инициализация базовых значений ключей и времени жизни кэша.
+
+        Запись считается свежей в течение времени, заданного политикой \
+        ttl_policy для ее семейства ключей, после чего еще stale_lifetime \
+        секунд отдается устаревшей с фоновым обновлением. Отсутствие \
+        сущности запоминается на not_found_lifetime секунд.
+        """
+        self.stale_lifetime = config.CACHE_STALE_TTL
+        self.not_found_lifetime = config.CACHE_NOT_FOUND_TTL
         self.full_menu = 'get_tree_menu'
         self.get_list_menu = 'get_list.menu'
         self.get_menu = 'get.menu.%(menu_id)s'
@@ -21,6 +376,54 @@ class BaseService:
         self.get_submenu = self.get_menu + '.submenu.%(submenu_id)s'
         self.get_list_dish = self.get_list_submenu + '.%(submenu_id)s.dish'
         self.get_dish = self.get_submenu + '.dish.%(dish_id)s'
+        self.page = '.page.%(limit)s.%(after)s'
+        self.get_page_menu = self.get_list_menu + self.page
+        self.get_page_submenu = self.get_list_submenu + self.page
+        self.get_page_dish = self.get_list_dish + self.page
+        self.tag_lifetime = TAG_LIFETIME
+        self.tag_global = TAG_GLOBAL
+        self.tag_menu = TAG_MENU
+        self.tag_submenu = TAG_SUBMENU
+        self.families = {
+            self.full_menu: 'tree',
+            self.get_list_menu: 'menu_list',
+            self.get_page_menu: 'menu_list',
+            self.get_menu: 'menu',
+            self.get_list_submenu: 'submenu_list',
+            self.get_page_submenu: 'submenu_list',
+            self.get_submenu: 'submenu',
+            self.get_list_dish: 'dish_list',
+            self.get_page_dish: 'dish_list',
+            self.get_dish: 'dish',
+        }
+        self.tags = {
+            self.full_menu: [self.tag_global],
+            self.get_list_menu: [self.tag_global],
+            self.get_page_menu: [self.tag_global],
+            self.get_menu: [self.tag_menu],
+            self.get_list_submenu: [self.tag_menu],
+            self.get_page_submenu: [self.tag_menu],
+            self.get_submenu: [self.tag_menu, self.tag_submenu],
+            self.get_list_dish: [self.tag_menu, self.tag_submenu],
+            self.get_page_dish: [self.tag_menu, self.tag_submenu],
+            self.get_dish: [self.tag_menu, self.tag_submenu],
+        }
+        self.tag_families = {
+            tag: {
+                self.families[template]
+                for template, tags in self.tags.items() if tag in tags
+            }
+            for tag in (self.tag_global, self.tag_menu, self.tag_submenu)
+        }
+
+    @property
+    def redis(self) -> aioredis.Redis:
+        """
+        Свойство возвращает общий для всех сервисов клиент Redis.
+
+        :return: Клиент Redis.
+        """
+        return get_redis()
 
     @classmethod
     async def get_lazy_s(cls, path_params: dict) -> dict:
@@ -37,59 +440,463 @@ class BaseService:
         }
         return s
 
-    async def set_cache(self, request: str, response: Any) -> None:
+    def get_tags(self, template: str, s: dict) -> list[str]:
+        """
+        Метод возвращает список тегов - счетчиков поколений, значения которых\
+        входят в ключ записи кэша, построенный по шаблону.
+
+        :param template: Шаблон ключа кэша.
+        :param s: Словарь с аргументами ленивой строки.
+        :return: Список тегов записи.
+        """
+        return [tag % s for tag in self.tags[template]]
+
+    async def get_key(self, template: str, s: dict) -> str:
+        """
+        Метод строит ключ записи кэша по шаблону с текущими поколениями его \
+        тегов. Поколения читаются из кэша процесса, а недостающие - одним \
+        запросом MGET из Redis.
+
+        :param template: Шаблон ключа кэша.
+        :param s: Словарь с аргументами ленивой строки.
+        :return: Ключ записи кэша.
+        """
+        tags = self.get_tags(template, s)
+        versions = [local_cache.get(tag) for tag in tags]
+        missing = [tag for tag, v in zip(tags, versions) if v is None]
+        if missing:
+            loaded = dict(zip(missing, await self.redis.mget(missing)))
+            for i, tag in enumerate(tags):
+                if versions[i] is None:
+                    versions[i] = int(loaded[tag] or 0)
+                    local_cache.set(tag, versions[i], 0)
+        return '%s@%s' % (template % s, '.'.join(map(str, versions)))
+
+    def get_families(self, tags: list[str]) -> set[str]:
+        """
+        Метод возвращает семейства ключей, записи которых инвалидируются \
+        увеличением поколений указанных тегов.
+
+        :param tags: Список тегов.
+        :return: Множество семейств ключей.
+        """
+        families: set[str] = set()
+        for tag in tags:
+            for template, names in self.tag_families.items():
+                if tag.startswith(template.split('%')[0]):
+                    families |= names
+        return families
+
+    def get_lifetime(self, template: str) -> int:
+        """
+        Метод возвращает время жизни записи кэша, построенной по шаблону: \
+        время свежести по политике ttl_policy и срок устаревания.
+
+        :param template: Шаблон ключа кэша.
+        :return: Время жизни записи в секундах.
         """
-        Функция задает значение кэша с ключом request и значением результата\
-        запроса.
+        return ttl_policy.get(self.families[template]) + self.stale_lifetime
+
+    @classmethod
+    def render(cls, schema: TypeAdapter | None, data: Any) -> bytes:
+        """
+        Метод проверяет результат запроса к базе данных по схеме ответа и \
+        сериализует его в готовое тело JSON-ответа. Без схемы результат \
+        считается документом JSON, уже собранным базой данных, и \
+        используется как есть.
+
+        :param schema: Адаптер схемы ответа.
+        :param data: Результат запроса к базе данных.
+        :return: Тело ответа в формате JSON.
+        """
+        if schema is None:
+            return data.encode()
+        return schema.dump_json(schema.validate_python(data))
+
+    @classmethod
+    def get_etag(cls, body: bytes) -> bytes:
+        """
+        Метод вычисляет ETag тела ответа - хэш в кавычках длиной ETAG_SIZE.
+
+        :param body: Тело ответа в формате JSON.
+        :return: Значение ETag.
+        """
+        digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+        return ('"%s"' % digest).encode()
+
+    @classmethod
+    def get_response(cls, request: Request, cache: bytes) -> Response:
+        """
+        Метод формирует ответ на get-запрос из записи кэша: ETag, \
+        вычисленный при заполнении кэша, и тело ответа. Если клиент передал \
+        совпадающий If-None-Match, возвращается пустой ответ 304 без \
+        передачи тела. Для записей, сохраненных без ETag, он вычисляется.
+
+        :param request: Запрос.
+        :param cache: Запись кэша - ETag и тело ответа в формате JSON.
+        :return: Ответ с телом или ответ 304.
+        """
+        if not cache.startswith(b'"'):
+            cache = cls.get_etag(cache) + cache
+        etag, body = cache[:ETAG_SIZE].decode(), cache[ETAG_SIZE:]
+        headers = {'ETag': etag}
+        if_none_match = request.headers.get('if-none-match', '')
+        client_etags = {
+            tag.strip().removeprefix('W/') for tag in if_none_match.split(',')
+        }
+        if etag in client_etags or '*' in client_etags:
+            return Response(status_code=304, headers=headers)
+        return Response(body, media_type='application/json', headers=headers)
+
+    @classmethod
+    def compress(cls, response: bytes) -> bytes:
+        """
+        Метод сжимает zlib записи кэша больше CACHE_COMPRESS_MIN_BYTES и \
+        добавляет в начало байт кодека. Небольшие записи хранятся как есть: \
+        они начинаются с кавычки ETag или признака отсутствия сущности, \
+        которые не совпадают ни с одним байтом кодека.
+
+        :param response: Запись кэша.
+        :return: Значение для записи в Redis.
+        """
+        if len(response) < config.CACHE_COMPRESS_MIN_BYTES:
+            return response
+        return ZLIB + zlib.compress(response, config.CACHE_COMPRESS_LEVEL)
+
+    @classmethod
+    def decompress(cls, value: bytes) -> bytes:
+        """
+        Метод восстанавливает запись кэша по байту кодека. Значения без \
+        байта кодека, в том числе записанные до включения сжатия, \
+        возвращаются как есть.
+
+        :param value: Значение из Redis.
+        :return: Запись кэша.
+        """
+        if value.startswith(ZLIB):
+            return zlib.decompress(value[len(ZLIB):])
+        return value
+
+    async def set_cache(
+            self,
+            request: str,
+            response: bytes,
+            lifetime: int
+    ) -> None:
+        """
+        Функция задает значение кэша с ключом request и значением готового\
+        тела JSON-ответа с его ETag. В Redis большие записи хранятся сжатыми, в кэше \
+        процесса - в исходном виде.
 
         :param request: Ключ запроса.
-        :param response: Ответ, полученный на запрос от базы данных.
+        :param response: Запись кэша.
+        :param lifetime: Время жизни записи в секундах.
         :return: None.
         """
-        response = pickle.dumps(response)
-        async with aioredis.from_url(self.url_redis) as redis:
-            await redis.set(request, response, ex=self.cache_lifetime)
+        await self.redis.set(
+            request,
+            self.compress(response),
+            ex=lifetime
+        )
+        local_cache.set(request, response, len(response))
 
-    async def get_cache(self, request: str) -> Any:
+    async def get_cache(self, request: str) -> tuple[bytes | None, bool]:
         """
-        Функция получает из кэша значение запроса к базе данных.
+        Функция получает из кэша готовое тело JSON-ответа с ETag и \
+        признак того, что срок свежести записи истек. Устаревшие записи не \
+        попадают в кэш процесса.
 
         :param request: Ключ запроса.
-        :return: Декодированные данные.
+        :return: Запись кэша или None и признак устаревания.
         """
-        async with aioredis.from_url(self.url_redis) as redis:
-            cache = await redis.get(request)
+        cache = local_cache.get(request)
+        if cache is not None:
+            return cache, False
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.get(request)
+            pipe.pttl(request)
+            cache, ttl = await pipe.execute()
+        if not cache:
+            return None, False
+        cache = self.decompress(cache)
+        found = not cache.startswith(NOT_FOUND)
+        stale = found and 0 <= ttl < self.stale_lifetime * 1000
+        if not stale:
+            local_cache.set(request, cache, len(cache))
+        return cache, stale
+
+    async def get_or_set_cache(
+            self,
+            template: str,
+            s: dict,
+            schema: TypeAdapter | None,
+            loader: Callable[[], Awaitable[Any]],
+            background_tasks: BackgroundTasks
+    ) -> bytes:
+        """
+        Метод возвращает кэш запроса, а при его отсутствии заполняет кэш \
+        результатом загрузчика. Заполнение защищено от одновременных промахов:\
+        внутри процесса запросы с одинаковым ключом ждут друг друга на общей \
+        asyncio-блокировке, между процессами - на короткой блокировке Redis. \
+        Ожидавшие запросы получают результат из заполненного кэша и \
+        учитываются как попадания. Устаревшая запись отдается сразу, а ее \
+        обновление ставится в фоновые задачи. \
+        Закэшированное отсутствие сущности возвращается ошибкой 404.
+
+        :param template: Шаблон ключа кэша.
+        :param s: Словарь с аргументами ленивой строки.
+        :param schema: Адаптер схемы ответа.
+        :param loader: Функция, выполняющая запрос к базе данных.
+        :param background_tasks: Фоновые задачи.
+        :return: Запись кэша - ETag и тело ответа в формате JSON.
+        """
+        family = self.families[template]
+        request = await self.get_key(template, s)
+        cache, stale = await self.get_cache(request)
         if cache:
-            cache = pickle.loads(cache)
+            cache_stats.hit(family, stale)
+            if stale:
+                background_tasks.add_task(
+                    self.refresh_cache,
+                    request,
+                    template,
+                    schema,
+                    loader
+                )
+            return self.check_found(cache)
+        entry = local_locks.setdefault(request, [asyncio.Lock(), 0])
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                cache, _ = await self.get_cache(request)
+                if cache:
+                    cache_stats.hit(family, False)
+                else:
+                    cache = await self.fill_cache(
+                        request,
+                        template,
+                        schema,
+                        loader
+                    )
+                return self.check_found(cache)
+        finally:
+            entry[1] -= 1
+            if not entry[1]:
+                del local_locks[request]
+
+    @classmethod
+    def check_found(cls, cache: bytes) -> bytes:
+        """
+        Метод возвращает запись кэша с телом ответа, а для записи об \
+        отсутствии сущности вызывает исключение 404 с сохраненным описанием.
+
+        :param cache: Запись кэша.
+        :return: Запись кэша - ETag и тело ответа в формате JSON.
+        """
+        if cache.startswith(NOT_FOUND):
+            raise HTTPException(
+                status_code=404,
+                detail=cache[len(NOT_FOUND):].decode()
+            )
         return cache
 
-    async def delete_cache(self, request: list[str]) -> None:
+    async def load_cache(
+            self,
+            request: str,
+            template: str,
+            schema: TypeAdapter | None,
+            loader: Callable[[], Awaitable[Any]]
+    ) -> bytes:
+        """
+        Метод выполняет запрос к базе данных и записывает результат в кэш \
+        вместе с его ETag, чтобы не хэшировать тело при каждом ответе. \
+        Ошибка 404 запоминается короткоживущей записью об отсутствии \
+        сущности, чтобы повторные запросы несуществующих идентификаторов не \
+        доходили до базы данных.
+
+        :param request: Ключ запроса.
+        :param template: Шаблон ключа кэша.
+        :param schema: Адаптер схемы ответа.
+        :param loader: Функция, выполняющая запрос к базе данных.
+        :return: Запись кэша.
+        """
+        try:
+            body = self.render(schema, await loader())
+        except HTTPException as e:
+            if e.status_code != 404:
+                raise
+            body = NOT_FOUND + str(e.detail).encode()
+            await self.set_cache(request, body, self.not_found_lifetime)
+            return body
+        cache = self.get_etag(body) + body
+        await self.set_cache(request, cache, self.get_lifetime(template))
+        return cache
+
+    async def fill_cache(
+            self,
+            request: str,
+            template: str,
+            schema: TypeAdapter | None,
+            loader: Callable[[], Awaitable[Any]]
+    ) -> bytes:
+        """
+        Метод под блокировкой Redis выполняет запрос к базе данных, \
+        записывает результат в кэш и учитывает промах. Если блокировку \
+        держал другой процесс, используется записанный им кэш, что \
+        учитывается как попадание. Блокировка ограничена по времени, \
+        поэтому сбой держателя не блокирует заполнение надолго.
+
+        :param request: Ключ запроса.
+        :param template: Шаблон ключа кэша.
+        :param schema: Адаптер схемы ответа.
+        :param loader: Функция, выполняющая запрос к базе данных.
+        :return: Запись кэша.
+        """
+        lock = self.redis.lock(
+            'lock.' + request,
+            timeout=config.CACHE_LOCK_TIMEOUT,
+            sleep=0.05,
+            blocking_timeout=config.CACHE_LOCK_WAIT
+        )
+        acquired = await lock.acquire()
+        family = self.families[template]
+        try:
+            cache, _ = await self.get_cache(request)
+            if cache:
+                cache_stats.hit(family, False)
+                return cache
+            started = time.perf_counter()
+            cache = await self.load_cache(request, template, schema, loader)
+            cache_stats.miss(family, time.perf_counter() - started, len(cache))
+            return cache
+        finally:
+            if acquired:
+                try:
+                    await lock.release()
+                except LockError:
+                    pass
+
+    async def refresh_cache(
+            self,
+            request: str,
+            template: str,
+            schema: TypeAdapter | None,
+            loader: Callable[[], Awaitable[Any]]
+    ) -> None:
         """
-        Функция удаляет записи кэша всех передаваемых ключей.
+        Метод перезаписывает устаревшую запись кэша свежим результатом \
+        запроса. Если блокировку ключа уже держит другой запрос, обновление \
+        пропускается, а если сущность уже удалена - запись заменяется \
+        записью об ее отсутствии.
 
-        :param request: Список ключей запроса для удаления.
-        :return:None.
+        :param request: Ключ запроса.
+        :param template: Шаблон ключа кэша.
+        :param schema: Адаптер схемы ответа.
+        :param loader: Функция, выполняющая запрос к базе данных.
+        :return: None.
+        """
+        lock = self.redis.lock(
+            'lock.' + request,
+            timeout=config.CACHE_LOCK_TIMEOUT
+        )
+        if not await lock.acquire(blocking=False):
+            return
+        try:
+            await self.load_cache(request, template, schema, loader)
+        finally:
+            try:
+                await lock.release()
+            except LockError:
+                pass
+
+    def add_invalidation(
+            self,
+            background_tasks: BackgroundTasks,
+            tags: list[str]
+    ) -> None:
+        """
+        Метод ставит инвалидацию тегов в фоновые задачи, которые выполняются\
+        после отправки ответа. Чтения процесса переводятся на основную базу \
+        данных сразу, до ответа, чтобы следующий запрос клиента после \
+        изменения данных не попал на отстающую реплику.
+
+        :param background_tasks: Фоновые задачи.
+        :param tags: Список тегов.
+        :return: None.
         """
-        async with aioredis.from_url(self.url_redis) as redis:
-            await redis.delete(*request)
+        hold_primary()
+        background_tasks.add_task(self.invalidate, tags)
 
-    async def get_keys_by_patterns(self, pattern: str) -> list:
+    async def invalidate(self, tags: list[str]) -> None:
         """
-        Метод получает список всех ключей кэша, хранящихся в Redis по \
-        подстроке.
+        Метод увеличивает поколения указанных тегов, после чего все записи \
+        кэша с прежними поколениями в ключе перестают читаться и истекают \
+        сами. Для инвалидации целого поддерева достаточно одного INCR. Другие\
+        процессы оповещаются о смене поколений через канал Redis.
 
-        :param pattern: Подстрока для поиска.
-        :return: Список всех найденных ключей.
+        :param tags: Список тегов.
+        :return: None.
         """
-        async with aioredis.from_url(self.url_redis) as redis:
-            return await redis.keys(pattern)
+        cache_stats.invalidate(self.get_families(tags))
+        local_cache.delete(*tags)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for tag in tags:
+                pipe.incr(tag)
+                pipe.expire(tag, self.tag_lifetime)
+            pipe.publish(INVALIDATION_CHANNEL, json.dumps(tags))
+            await pipe.execute()
 
     async def flush_redis(self) -> None:
         """
-        Очищает весь кэш из redis.
+        Очищает весь кэш из redis и кэши процессов приложения.
+
+        :return: None.
+        """
+        local_cache.clear()
+        await self.redis.flushdb(asynchronous=True)
+        await self.redis.publish(INVALIDATION_CHANNEL, FLUSH_MESSAGE)
+
+    async def warm_up(self) -> None:
+        """
+        Метод прогрева кэша, переопределяется в сервисе приложения.
+
+        :return: None.
+        """
+
+    async def listen_invalidation(self) -> None:
+        """
+        Метод подписывается на канал оповещений об удалении кэша и удаляет \
+        соответствующие записи из кэша процесса, переводя чтения на основную \
+        базу данных на время задержки реплики. При потере соединения кэш \
+        процесса очищается, так как часть оповещений могла быть пропущена. \
+        По оповещению о прогреве кэш прогревается в отдельной задаче, если \
+        предыдущий прогрев уже завершен.
 
         :return: None.
         """
-        async with aioredis.from_url(self.url_redis) as redis:
-            await redis.flushdb(asynchronous=True)
-            await redis.connection_pool.disconnect()
+        warm_up_task: asyncio.Task | None = None
+        while True:
+            pubsub = self.redis.pubsub()
+            try:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                while True:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True,
+                        timeout=1.0
+                    )
+                    if message is None:
+                        continue
+                    data = message['data'].decode()
+                    if data == FLUSH_MESSAGE:
+                        local_cache.clear()
+                    elif data == WARM_UP_MESSAGE:
+                        if warm_up_task is None or warm_up_task.done():
+                            warm_up_task = asyncio.create_task(self.warm_up())
+                    else:
+                        hold_primary()
+                        local_cache.delete(*json.loads(data))
+            except (aioredis.ConnectionError, aioredis.TimeoutError):
+                local_cache.clear()
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.close()
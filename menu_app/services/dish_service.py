@@ -1,13 +1,15 @@
 """Модуль сервисного слоя для модели Dish."""
 from uuid import UUID
 
-from sqlalchemy import RowMapping, Sequence
+from fastapi import HTTPException
+from pydantic import TypeAdapter
+from sqlalchemy import RowMapping
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.background import BackgroundTasks
 from starlette.responses import JSONResponse
 
 from menu_app.repositories.dish_repository import DishRepository, repository
-from menu_app.schemas.dish_schemas import Dish, DishCreate
+from menu_app.schemas.dish_schemas import Dish, DishCreate, DishPage
 from menu_app.services.base_service import BaseService
 
 
@@ -18,37 +20,55 @@ class DishService(BaseService):
         """Инициализация класса с указанием слоя репозитория."""
         super().__init__()
         self.repository: DishRepository = repository
+        self.schema: TypeAdapter = TypeAdapter(Dish)
+        self.list_schema: TypeAdapter = TypeAdapter(list[Dish])
+        self.page_schema: TypeAdapter = TypeAdapter(DishPage)
 
     async def get_list(
             self,
             db: AsyncSession,
-            path_params: dict
-    ) -> Sequence:
+            submenu_id: UUID,
+            path_params: dict,
+            background_tasks: BackgroundTasks,
+            limit: int | None = None,
+            after: UUID | None = None
+    ) -> bytes:
         """
         Метод проверяет наличие кэша запроса. При положительном результате\
         возвращает полученный кэш, в противном случае получает результат\
-        запроса списка блюд, устанавливает кэш и передает данные в роутер.
+        запроса списка блюд, устанавливает кэш и передает данные в роутер. \
+        При переданном размере страницы кэшируется и возвращается только \
+        страница списка после курсора.
 
         :param db: Экземпляром сеанса базы данных.
+        :param submenu_id: Идентификатор под-меню.
         :param path_params: Словарь со списком параметров пути.
-        :return: Список блюд.
+        :param background_tasks: Фоновые задачи.
+        :param limit: Размер страницы.
+        :param after: Курсор - идентификатор последней строки предыдущей \
+        страницы.
+        :return: Список блюд в формате JSON.
         """
         s: dict = await self.get_lazy_s(path_params)
-        cache = await self.get_cache(
-            self.get_list_dish % s
+        template, schema = self.get_list_dish, self.list_schema
+        if limit is not None:
+            template, schema = self.get_page_dish, self.page_schema
+            s.update(limit=limit, after=after or '')
+        return await self.get_or_set_cache(
+            template,
+            s,
+            schema,
+            lambda: self.repository.get_list(db, submenu_id, limit, after),
+            background_tasks
         )
-        if cache:
-            return cache
-        result = await self.repository.get_list(db)
-        await self.set_cache(self.get_list_dish % s, result)
-        return result
 
     async def get(
             self,
             db: AsyncSession,
             dish_id: UUID,
-            path_params: dict
-    ) -> RowMapping:
+            path_params: dict,
+            background_tasks: BackgroundTasks
+    ) -> bytes:
         """
         Метод проверяет наличие кэша запроса. При положительном результате\
         возвращает полученный кэш, в противном случае получает результат\
@@ -57,15 +77,17 @@ class DishService(BaseService):
         :param db: Экземпляром сеанса базы данных.
         :param dish_id: Идентификатор блюда.
         :param path_params: Словарь со списком параметров пути.
-        :return: Экземпляр модели.
+        :param background_tasks: Фоновые задачи.
+        :return: Экземпляр модели в формате JSON.
         """
         s: dict = await self.get_lazy_s(path_params)
-        cache = await self.get_cache(self.get_dish % s)
-        if cache:
-            return cache
-        result = await self.repository.get(db, dish_id)
-        await self.set_cache(self.get_dish % s, result)
-        return result
+        return await self.get_or_set_cache(
+            self.get_dish,
+            s,
+            self.schema,
+            lambda: self.repository.get(db, dish_id),
+            background_tasks
+        )
 
     async def create(
             self,
@@ -77,8 +99,8 @@ class DishService(BaseService):
     ) -> Dish:
         """
         Метод работает с методом создания нового экземпляра блюда, удаляя из\
-        кэша записи результатов запросов: получения списков меню, под-меню и \
-        блюд; информации о меню и под-меню, связанных с блюдом.
+        кэша записи по общему тегу списка и древовидного меню, а также меню и \
+        под-меню, связанных с блюдом.
 
         :param db: Экземпляром сеанса базы данных.
         :param data: Данные для создания нового экземпляра.
@@ -88,18 +110,54 @@ class DishService(BaseService):
         :return: Экземпляр созданного блюда.
         """
         s: dict = await self.get_lazy_s(path_params)
-        background_tasks.add_task(
-            self.delete_cache,
+        self.add_invalidation(
+            background_tasks,
             [
-                self.get_list_menu,
-                self.get_menu % s,
-                self.get_list_submenu % s,
-                self.get_submenu % s,
-                self.get_list_dish % s,
+                self.tag_global,
+                self.tag_menu % s,
+                self.tag_submenu % s
             ]
         )
         return await self.repository.create(db, data, submenu_id)
 
+    async def bulk_create(
+            self,
+            db: AsyncSession,
+            data: list[DishCreate],
+            submenu_id: UUID,
+            path_params: dict,
+            background_tasks: BackgroundTasks
+    ) -> list[RowMapping]:
+        """
+        Метод создает или обновляет блюда под-меню одним запросом и удаляет \
+        из кэша записи по общему тегу списка и древовидного меню, а также \
+        меню и под-меню одной инвалидацией на весь список. Список с \
+        повторяющимися названиями блюд отклоняется с ошибкой 422.
+
+        :param db: Экземпляром сеанса базы данных.
+        :param data: Данные блюд.
+        :param submenu_id: Идентификатор под-меню, к которому относятся блюда.
+        :param path_params: Словарь со списком параметров пути.
+        :param background_tasks: Фоновые задачи.
+        :return: Созданные и обновленные блюда.
+        """
+        if len({item.title for item in data}) < len(data):
+            raise HTTPException(
+                status_code=422,
+                detail='dish titles are duplicated'
+            )
+        result = await self.repository.bulk_upsert(db, data, submenu_id)
+        s: dict = await self.get_lazy_s(path_params)
+        self.add_invalidation(
+            background_tasks,
+            [
+                self.tag_global,
+                self.tag_menu % s,
+                self.tag_submenu % s
+            ]
+        )
+        return result
+
     async def update(
             self,
             db: AsyncSession,
@@ -107,9 +165,11 @@ class DishService(BaseService):
             dish_id: UUID,
             path_params: dict,
             background_tasks: BackgroundTasks
-    ) -> Dish:
+    ) -> RowMapping:
         """
-        Метод удаляет из кэша записи запросов списка блюд и обновляемого блюда.
+        Метод удаляет из кэша записи по общему тегу списка и древовидного \
+        меню и тегу под-меню, к которому относятся список блюд и обновляемое \
+        блюдо.
 
         :param db: Экземпляром сеанса базы данных.
         :param data: Данные для обновления.
@@ -119,9 +179,9 @@ class DishService(BaseService):
         :return: Экземпляр блюда с обновленными данными.
         """
         s: dict = await self.get_lazy_s(path_params)
-        background_tasks.add_task(
-            self.delete_cache,
-            [self.get_list_dish % s, self.get_dish % s]
+        self.add_invalidation(
+            background_tasks,
+            [self.tag_global, self.tag_submenu % s]
         )
         return await self.repository.update(db, data, dish_id)
 
@@ -133,27 +193,32 @@ class DishService(BaseService):
             background_tasks: BackgroundTasks
     ) -> JSONResponse:
         """
-        Метод удаляет весь кэш при удалении блюда и возвращает ответ \
-        пользователю об успехе или неудачи удаления.
+        Метод удаляет кэш по общему тегу списка и древовидного меню, а также \
+        меню и под-меню, связанных с блюдом, и возвращает ответ пользователю \
+        об успехе удаления.
 
         :param db: Экземпляром сеанса базы данных.
         :param dish_id: Идентификатор удаляемого блюда.
         :param path_params: Словарь со списком параметров пути.
         :param background_tasks: Фоновые задачи.
-        :return: Ответ об успехе или неудачи удаления.
+        :return: Ответ об успехе удаления.
         """
+        await self.repository.remove(db, dish_id)
         s: dict = await self.get_lazy_s(path_params)
-        delete_list = [
-            self.get_list_menu,
-            self.get_menu % s,
-            self.get_list_submenu % s,
-            self.get_submenu % s,
-            self.get_list_dish % s
-        ]
-        delete_list += await self.get_keys_by_patterns(f'*{dish_id}*')
-        background_tasks.add_task(self.delete_cache, delete_list)
-        result = await self.repository.remove(db, dish_id)
-        return result
+        self.add_invalidation(
+            background_tasks,
+            [
+                self.tag_global,
+                self.tag_menu % s,
+                self.tag_submenu % s
+            ]
+        )
+        return JSONResponse(
+            status_code=200,
+            content={
+                'message': 'The dish has been deleted'
+            }
+        )
 
 
 service: DishService = DishService()
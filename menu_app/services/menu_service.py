@@ -1,13 +1,14 @@
 """Модуль сервисного слоя для модели Menu."""
 from uuid import UUID
 
-from sqlalchemy import RowMapping, Sequence
+from pydantic import TypeAdapter
+from sqlalchemy import RowMapping
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.background import BackgroundTasks
 from starlette.responses import JSONResponse
 
 from menu_app.repositories.menu_repository import MenuRepository, repository
-from menu_app.schemas.menu_schemas import Menu, MenuCreate
+from menu_app.schemas.menu_schemas import Menu, MenuCreate, MenuPage
 from menu_app.services.base_service import BaseService
 
 
@@ -18,32 +19,51 @@ class MenuService(BaseService):
         """Инициализация класса с указанием слоя репозитория."""
         super().__init__()
         self.repository: MenuRepository = repository
+        self.schema: TypeAdapter = TypeAdapter(Menu)
+        self.list_schema: TypeAdapter = TypeAdapter(list[Menu])
+        self.page_schema: TypeAdapter = TypeAdapter(MenuPage)
 
     async def get_list(
             self,
-            db: AsyncSession
-    ) -> Sequence:
+            db: AsyncSession,
+            background_tasks: BackgroundTasks,
+            limit: int | None = None,
+            after: UUID | None = None
+    ) -> bytes:
         """
         Метод проверяет наличие кэша запроса. При положительном результате\
         возвращает полученный кэш, в противном случае получает результат\
-        запроса списка меню, устанавливает кэш и передает данные в роутер.
+        запроса списка меню, устанавливает кэш и передает данные в роутер. \
+        При переданном размере страницы кэшируется и возвращается только \
+        страница списка после курсора.
 
         :param db: Экземпляром сеанса базы данных.
-        :return: Список меню.
+        :param background_tasks: Фоновые задачи.
+        :param limit: Размер страницы.
+        :param after: Курсор - идентификатор последней строки предыдущей \
+        страницы.
+        :return: Список меню в формате JSON.
         """
-        cache = await self.get_cache(self.get_list_menu)
-        if cache:
-            return cache
-        result = await self.repository.get_list(db)
-        await self.set_cache(self.get_list_menu, result)
-        return result
+        s: dict = {}
+        template, schema = self.get_list_menu, self.list_schema
+        if limit is not None:
+            template, schema = self.get_page_menu, self.page_schema
+            s.update(limit=limit, after=after or '')
+        return await self.get_or_set_cache(
+            template,
+            s,
+            schema,
+            lambda: self.repository.get_list(db, limit=limit, after=after),
+            background_tasks
+        )
 
     async def get(
             self,
             db: AsyncSession,
             menu_id: UUID,
-            path_params: dict
-    ) -> RowMapping:
+            path_params: dict,
+            background_tasks: BackgroundTasks
+    ) -> bytes:
         """
         Метод проверяет наличие кэша запроса. При положительном результате\
         возвращает полученный кэш, в противном случае получает результат\
@@ -52,17 +72,17 @@ class MenuService(BaseService):
         :param db: Экземпляром сеанса базы данных.
         :param menu_id: Идентификатор меню.
         :param path_params: Словарь со списком параметров пути.
-        :return: Экземпляр модели.
+        :param background_tasks: Фоновые задачи.
+        :return: Экземпляр модели в формате JSON.
         """
         s: dict = await self.get_lazy_s(path_params)
-        cache = await self.get_cache(
-            self.get_menu % s
+        return await self.get_or_set_cache(
+            self.get_menu,
+            s,
+            self.schema,
+            lambda: self.repository.get(db, menu_id),
+            background_tasks
         )
-        if cache:
-            return cache
-        result = await self.repository.get(db, menu_id)
-        await self.set_cache(self.get_menu % s, result)
-        return result
 
     async def create(
             self,
@@ -72,14 +92,17 @@ class MenuService(BaseService):
     ) -> Menu:
         """
         Метод работает с методом создания нового экземпляра меню, удаляя из\
-        кэша записи результатов запроса получения списка меню.
+        кэша записи по общему тегу списка и древовидного меню.
 
         :param db: Экземпляром сеанса базы данных.
         :param data: Данные для создания нового экземпляра.
         :param background_tasks: Фоновые задачи.
         :return: Экземпляр созданного меню.
         """
-        background_tasks.add_task(self.delete_cache, [self.get_list_menu])
+        self.add_invalidation(
+            background_tasks,
+            [self.tag_global]
+        )
         return await self.repository.create(db, data)
 
     async def update(
@@ -89,9 +112,10 @@ class MenuService(BaseService):
             menu_id: UUID,
             path_params: dict,
             background_tasks: BackgroundTasks
-    ) -> Menu:
+    ) -> RowMapping:
         """
-        Метод удаляет из кэша записи запросов списка меню и обновляемого меню.
+        Метод удаляет из кэша записи по общему тегу списка и древовидного \
+        меню и тегу обновляемого меню.
 
         :param db: Экземпляром сеанса базы данных.
         :param data: Данные для обновления.
@@ -101,9 +125,9 @@ class MenuService(BaseService):
         :return: Экземпляр меню с обновленными данными.
         """
         s: dict = await self.get_lazy_s(path_params)
-        background_tasks.add_task(
-            self.delete_cache,
-            [self.get_list_menu, self.get_menu % s]
+        self.add_invalidation(
+            background_tasks,
+            [self.tag_global, self.tag_menu % s]
         )
         return await self.repository.update(db, data, menu_id)
 
@@ -114,19 +138,33 @@ class MenuService(BaseService):
             background_tasks: BackgroundTasks
     ) -> JSONResponse:
         """
-        Метод удаляет кэш при удалении меню и возвращает ответ пользователю \
-        об успехе или неудачи удаления.
+        Метод удаляет меню и кэш по общему тегу списка и древовидного меню, \
+        самого меню и каскадно удаленных под-меню и возвращает ответ \
+        пользователю об успехе удаления.
 
         :param db: Экземпляром сеанса базы данных.
         :param menu_id: Идентификатор удаляемого меню.
         :param background_tasks: Фоновые задачи.
-        :return: Ответ об успехе или неудачи удаления.
+        :return: Ответ об успехе удаления.
         """
-        delete_list = [self.get_list_menu]
-        delete_list += await self.get_keys_by_patterns(f'*{menu_id}*')
-        background_tasks.add_task(self.delete_cache, delete_list)
         result = await self.repository.remove(db, menu_id)
-        return result
+        self.add_invalidation(
+            background_tasks,
+            [
+                self.tag_global,
+                self.tag_menu % {'menu_id': menu_id},
+                *[
+                    self.tag_submenu % {'submenu_id': submenu_id}
+                    for submenu_id in result['submenus'] or []
+                ]
+            ]
+        )
+        return JSONResponse(
+            status_code=200,
+            content={
+                'message': 'The menu has been deleted'
+            }
+        )
 
 
 service: MenuService = MenuService()
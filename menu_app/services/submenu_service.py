@@ -1,13 +1,14 @@
 """Модуль сервисного слоя для модели Submenu."""
 from uuid import UUID
 
-from sqlalchemy import RowMapping, Sequence
+from pydantic import TypeAdapter
+from sqlalchemy import RowMapping
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.background import BackgroundTasks
 from starlette.responses import JSONResponse
 
 from menu_app.repositories.submenu_repository import SubmenuRepository, repository
-from menu_app.schemas.submenu_schemas import Submenu, SubmenuCreate
+from menu_app.schemas.submenu_schemas import Submenu, SubmenuCreate, SubmenuPage
 from menu_app.services.base_service import BaseService
 
 
@@ -18,34 +19,55 @@ class SubmenuService(BaseService):
         """Инициализация класса с указанием слоя репозитория."""
         super().__init__()
         self.repository: SubmenuRepository = repository
+        self.schema: TypeAdapter = TypeAdapter(Submenu)
+        self.list_schema: TypeAdapter = TypeAdapter(list[Submenu])
+        self.page_schema: TypeAdapter = TypeAdapter(SubmenuPage)
 
     async def get_list(
             self,
-            db: AsyncSession, path_params: dict
-    ) -> Sequence:
+            db: AsyncSession,
+            menu_id: UUID,
+            path_params: dict,
+            background_tasks: BackgroundTasks,
+            limit: int | None = None,
+            after: UUID | None = None
+    ) -> bytes:
         """
         Метод проверяет наличие кэша запроса. При положительном результате\
         возвращает полученный кэш, в противном случае получает результат\
-        запроса списка под-меню, устанавливает кэш и передает данные в роутер.
+        запроса списка под-меню, устанавливает кэш и передает данные в \
+        роутер. При переданном размере страницы кэшируется и возвращается \
+        только страница списка после курсора.
 
         :param db: Экземпляром сеанса базы данных.
+        :param menu_id: Идентификатор меню.
         :param path_params: Словарь со списком параметров пути.
-        :return: Список под-меню.
+        :param background_tasks: Фоновые задачи.
+        :param limit: Размер страницы.
+        :param after: Курсор - идентификатор последней строки предыдущей \
+        страницы.
+        :return: Список под-меню в формате JSON.
         """
         s: dict = await self.get_lazy_s(path_params)
-        cache = await self.get_cache(self.get_list_submenu % s)
-        if cache:
-            return cache
-        result = await self.repository.get_list(db)
-        await self.set_cache(self.get_list_submenu % s, result)
-        return result
+        template, schema = self.get_list_submenu, self.list_schema
+        if limit is not None:
+            template, schema = self.get_page_submenu, self.page_schema
+            s.update(limit=limit, after=after or '')
+        return await self.get_or_set_cache(
+            template,
+            s,
+            schema,
+            lambda: self.repository.get_list(db, menu_id, limit, after),
+            background_tasks
+        )
 
     async def get(
             self,
             db: AsyncSession,
             submenu_id: UUID,
-            path_params: dict
-    ) -> RowMapping:
+            path_params: dict,
+            background_tasks: BackgroundTasks
+    ) -> bytes:
         """
         Метод проверяет наличие кэша запроса. При положительном результате\
         возвращает полученный кэш, в противном случае получает результат\
@@ -55,15 +77,17 @@ class SubmenuService(BaseService):
         :param db: Экземпляром сеанса базы данных.
         :param submenu_id: Идентификатор под-меню.
         :param path_params: Словарь со списком параметров пути.
-        :return: Экземпляр модели.
+        :param background_tasks: Фоновые задачи.
+        :return: Экземпляр модели в формате JSON.
         """
         s: dict = await self.get_lazy_s(path_params)
-        cache = await self.get_cache(self.get_submenu % s)
-        if cache:
-            return cache
-        result = await self.repository.get(db, submenu_id)
-        await self.set_cache(self.get_submenu % s, result)
-        return result
+        return await self.get_or_set_cache(
+            self.get_submenu,
+            s,
+            self.schema,
+            lambda: self.repository.get(db, submenu_id),
+            background_tasks
+        )
 
     async def create(
             self,
@@ -75,8 +99,8 @@ class SubmenuService(BaseService):
     ) -> Submenu:
         """
         Метод работает с методом создания нового экземпляра под-меню, удаляя \
-        из кэша записи результатов запросов: получения списков меню, под-меню;\
-        информации о меню, связанного с под-меню.
+        из кэша записи по общему тегу списка и древовидного меню и меню, \
+        связанного с под-меню.
 
         :param db: Экземпляром сеанса базы данных.
         :param data: Данные для создания нового экземпляра.
@@ -86,9 +110,9 @@ class SubmenuService(BaseService):
         :return: Экземпляр созданного под-меню.
         """
         s: dict = await self.get_lazy_s(path_params)
-        background_tasks.add_task(
-            self.delete_cache,
-            [self.get_list_menu, self.get_menu % s, self.get_list_submenu % s]
+        self.add_invalidation(
+            background_tasks,
+            [self.tag_global, self.tag_menu % s]
         )
         return await self.repository.create(db, data, menu_id)
 
@@ -99,9 +123,10 @@ class SubmenuService(BaseService):
             submenu_id: UUID,
             path_params: dict,
             background_tasks: BackgroundTasks
-    ) -> Submenu:
+    ) -> RowMapping:
         """
-        Метод удаляет из кэша записи запросов списка под-меню и обновляемого\
+        Метод удаляет из кэша записи по общему тегу списка и древовидного \
+        меню и тегу меню, к которому относятся список под-меню и обновляемое \
         под-меню.
 
         :param db: Экземпляром сеанса базы данных.
@@ -112,9 +137,9 @@ class SubmenuService(BaseService):
         :return: Экземпляр под-меню с обновленными данными.
         """
         s: dict = await self.get_lazy_s(path_params)
-        background_tasks.add_task(
-            self.delete_cache,
-            [self.get_list_submenu % s, self.get_submenu % s]
+        self.add_invalidation(
+            background_tasks,
+            [self.tag_global, self.tag_menu % s, self.tag_submenu % s]
         )
         return await self.repository.update(db, data, submenu_id)
 
@@ -126,25 +151,31 @@ class SubmenuService(BaseService):
             background_tasks: BackgroundTasks
     ) -> JSONResponse:
         """
-        Метод удаляет кэш при удалении под-меню и возвращает ответ \
-        пользователю об успехе или неудачи удаления.
+        Метод удаляет кэш по общему тегу списка и древовидного меню, меню и \
+        самого под-меню и возвращает ответ пользователю об успехе удаления.
 
         :param db: Экземпляром сеанса базы данных.
         :param submenu_id: Идентификатор удаляемого под-меню.
         :param path_params: Словарь со списком параметров пути.
         :param background_tasks: Фоновые задачи.
-        :return: Ответ об успехе или неудачи удаления.
+        :return: Ответ об успехе удаления.
         """
+        await self.repository.remove(db, submenu_id)
         s: dict = await self.get_lazy_s(path_params)
-        delete_list = [
-            self.get_list_menu,
-            self.get_menu % s,
-            self.get_list_submenu % s,
-            self.get_submenu % s
-        ]
-        delete_list += await self.get_keys_by_patterns(f'*{submenu_id}*')
-        background_tasks.add_task(self.delete_cache, delete_list)
-        return await self.repository.remove(db, submenu_id)
+        self.add_invalidation(
+            background_tasks,
+            [
+                self.tag_global,
+                self.tag_menu % s,
+                self.tag_submenu % s
+            ]
+        )
+        return JSONResponse(
+            status_code=200,
+            content={
+                'message': 'The submenu has been deleted'
+            }
+        )
 
 
 service: SubmenuService = SubmenuService()
@@ -1,16 +1,29 @@
 """Модуль фоновых задач, обрабатываемых Celery."""
 import csv
+import decimal
+import json
+import sys
 from io import StringIO
 from uuid import UUID
 
 import requests
 from openpyxl import Workbook, load_workbook
 from requests import Response
-from sqlalchemy import delete
+from sqlalchemy import Delete, delete, func, select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import get_history
 
+from menu_app.cache import (
+    INVALIDATION_CHANNEL,
+    TAG_GLOBAL,
+    TAG_LIFETIME,
+    TAG_MENU,
+    TAG_SUBMENU,
+    WARM_UP_MESSAGE,
+)
 from menu_app.config import config
 from menu_app.models import Dish, Menu, Submenu
-from menu_app.worker import SyncSessionLocal, celery
+from menu_app.worker import SyncSessionLocal, celery, redis_client
 
 fields_menu = ('id', 'title', 'description')
 fields_submenu = ('menu_id', 'id', 'title', 'description')
@@ -118,11 +131,125 @@ def _get_file() -> Workbook:
     return load_workbook(config.BASE_DIR / 'admin/Menu.xlsx')
 
 
+def _get_dish(data: list) -> Dish:
+    """
+    Функция создает блюдо из строки данных, приводя цену и скидку к типам \
+    столбцов, чтобы при слиянии неизмененные блюда не считались измененными.
+
+    :param data: Строка данных блюда.
+    :return: Экземпляр блюда.
+    """
+    fields = dict(zip(fields_dish, data))
+    fields['price'] = decimal.Decimal(str(fields['price']))
+    fields['discount'] = int(fields['discount'] or 0)
+    return Dish(**fields)
+
+
+def _get_parent_ids(obj: Submenu | Dish, name: str) -> set[UUID]:
+    """
+    Функция возвращает текущий и, если он изменился при слиянии, прежний \
+    идентификатор родителя сущности.
+
+    :param obj: Экземпляр под-меню или блюда.
+    :param name: Имя атрибута с идентификатором родителя.
+    :return: Множество идентификаторов родителя.
+    """
+    return {getattr(obj, name), *get_history(obj, name).deleted}
+
+
+def _get_changed_tags(
+        db: Session,
+        parents: dict[UUID, UUID],
+        query_menu: Delete,
+        query_submenu: Delete,
+        query_dish: Delete
+) -> list[str]:
+    """
+    Функция удаляет отсутствующие в импорте сущности и возвращает теги \
+    кэша, поколения которых нужно увеличить: общий тег, теги созданных, \
+    измененных и удаленных меню и под-меню, а для блюд - теги их под-меню \
+    и меню. Так сбрасываются и закэшированные ответы 404 по \
+    идентификаторам созданных сущностей, и устаревшие экземпляры. Если \
+    данные не изменились, возвращается пустой список.
+
+    :param db: Экземпляр сеанса базы данных после слияния импорта.
+    :param parents: Идентификаторы меню импортируемых под-меню.
+    :param query_menu: Запрос удаления меню.
+    :param query_submenu: Запрос удаления под-меню.
+    :param query_dish: Запрос удаления блюд.
+    :return: Список тегов кэша.
+    """
+    menu_ids: set[UUID | None] = set()
+    submenu_ids: set[UUID] = set()
+    changed = list(db.new) + [
+        obj for obj in db.dirty
+        if db.is_modified(obj, include_collections=False)
+    ]
+    menu_ids.update(db.scalars(query_menu.returning(Menu.id)))
+    for submenu_id, menu_id in db.execute(
+            query_submenu.returning(Submenu.id, Submenu.menu_id)
+    ):
+        submenu_ids.add(submenu_id)
+        menu_ids.add(menu_id)
+        parents[submenu_id] = menu_id
+    submenu_ids.update(db.scalars(query_dish.returning(Dish.submenu_id)))
+    for obj in changed:
+        if isinstance(obj, Menu):
+            menu_ids.add(obj.id)
+        elif isinstance(obj, Submenu):
+            submenu_ids.add(obj.id)
+            menu_ids.update(_get_parent_ids(obj, 'menu_id'))
+        else:
+            submenu_ids.update(_get_parent_ids(obj, 'submenu_id'))
+    menu_ids.update(parents.get(submenu_id) for submenu_id in submenu_ids)
+    menu_ids.discard(None)
+    if not menu_ids and not submenu_ids:
+        return []
+    return [
+        TAG_GLOBAL,
+        *(TAG_MENU % {'menu_id': menu_id} for menu_id in menu_ids),
+        *(
+            TAG_SUBMENU % {'submenu_id': submenu_id}
+            for submenu_id in submenu_ids
+        ),
+    ]
+
+
+def _invalidate(tags: list[str]) -> None:
+    """
+    Функция увеличивает поколения тегов кэша и оповещает процессы \
+    приложения об их смене.
+
+    :param tags: Список тегов.
+    :return: None.
+    """
+    if not tags:
+        return
+    with redis_client.pipeline(transaction=False) as pipe:
+        for tag in tags:
+            pipe.incr(tag)
+            pipe.expire(tag, TAG_LIFETIME)
+        pipe.publish(INVALIDATION_CHANNEL, json.dumps(tags))
+        pipe.execute()
+
+
+def _warm_up() -> None:
+    """
+    Функция оповещает процессы приложения о необходимости прогреть кэш \
+    после обновления данных. Прогрев выполнит один из процессов.
+
+    :return: None.
+    """
+    redis_client.publish(INVALIDATION_CHANNEL, WARM_UP_MESSAGE)
+
+
 @celery.task
 def update_db_from_excel() -> None:
     """
     Функция обновляет данные в базе из excel файла в фоновом режиме каждые 15\
-     секунд. А если файл недоступен обновление производится из Google Sheets.
+     секунд. А если файл недоступен обновление производится из Google Sheets.\
+    Если данные изменились, увеличиваются поколения тегов кэша затронутых \
+    меню и под-меню и прогревается кэш.
 
     :return: None.
     """
@@ -149,23 +276,61 @@ def update_db_from_excel() -> None:
         Submenu(**dict(zip(fields_submenu, data)))
         for data in submenu_data_list
     ]
-    dish_list = [
-        Dish(**dict(zip(fields_dish, data))) for data in dish_data_list
-    ]
+    dish_list = [_get_dish(data) for data in dish_data_list]
     obj_list = menu_list + submenu_list + dish_list
     with SyncSessionLocal() as db:
         for obj in obj_list:
             db.merge(obj)
-        query_menu = delete(Menu).filter(Menu.id.not_in(id_dict['menu']))
-        query_submenu = delete(Submenu).filter(
-            Submenu.id.not_in(id_dict['submenu'])
+        tags = _get_changed_tags(
+            db,
+            {submenu.id: submenu.menu_id for submenu in submenu_list},
+            delete(Menu).filter(Menu.id.not_in(id_dict['menu'])),
+            delete(Submenu).filter(Submenu.id.not_in(id_dict['submenu'])),
+            delete(Dish).filter(Dish.id.not_in(id_dict['dish']))
+        )
+        db.commit()
+    if not tags:
+        return
+    _invalidate(tags)
+    _warm_up()
+
+
+@celery.task
+def recount_counters() -> None:
+    """
+    Функция пересчитывает с нуля количество блюд в под-меню, а также \
+    количество под-меню и блюд в меню, и прогревает кэш с исправленными \
+    значениями. Используется для восстановления счетчиков, если они \
+    разошлись с данными, например после ручного изменения базы.
+
+    :return: None.
+    """
+    with SyncSessionLocal() as db:
+        db.execute(
+            update(Submenu).values(
+                dishes_count=select(func.count(Dish.id))
+                .filter(Dish.submenu_id == Submenu.id)
+                .scalar_subquery()
+            )
+        )
+        db.execute(
+            update(Menu).values(
+                submenus_count=select(func.count(Submenu.id))
+                .filter(Submenu.menu_id == Menu.id)
+                .scalar_subquery(),
+                dishes_count=select(
+                    func.coalesce(func.sum(Submenu.dishes_count), 0)
+                )
+                .filter(Submenu.menu_id == Menu.id)
+                .scalar_subquery()
+            )
         )
-        query_dish = delete(Dish).filter(Dish.id.not_in(id_dict['dish']))
-        db.execute(query_menu)
-        db.execute(query_submenu)
-        db.execute(query_dish)
         db.commit()
+    _warm_up()
 
 
 if __name__ == '__main__':
-    update_db_from_excel()
+    if sys.argv[1:] == ['recount']:
+        recount_counters()
+    else:
+        update_db_from_excel()
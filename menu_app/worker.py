@@ -1,5 +1,6 @@
 """Модуль инициализации и конфигурирования Celery."""
 from celery import Celery
+from redis import Redis
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
@@ -19,3 +20,4 @@ SyncSessionLocal = sessionmaker(
     autoflush=False,
     bind=sync_engine,
 )
+redis_client = Redis.from_url(config.url_redis)
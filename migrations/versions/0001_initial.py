@@ -0,0 +1,69 @@
+"""Начальная схема меню, под-меню и блюд.
+
+Revision ID: 0001
+Revises:
+Create Date: 2023-07-30 12:00:00
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Функция создает таблицы в том виде, в котором их создавал create_all \
+    при запуске приложения. Существующие базы помечаются этой ревизией \
+    командой alembic stamp 0001.
+
+    :return: None.
+    """
+    op.create_table(
+        'menus',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('title', sa.String(), nullable=True),
+        sa.Column('description', sa.String(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_menus_id', 'menus', ['id'])
+    op.create_index('ix_menus_title', 'menus', ['title'], unique=True)
+    op.create_table(
+        'submenus',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('title', sa.String(), nullable=True),
+        sa.Column('description', sa.String(), nullable=True),
+        sa.Column('menu_id', sa.UUID(), nullable=True),
+        sa.ForeignKeyConstraint(['menu_id'], ['menus.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_submenus_id', 'submenus', ['id'])
+    op.create_index('ix_submenus_title', 'submenus', ['title'], unique=True)
+    op.create_table(
+        'dishes',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('title', sa.String(), nullable=True),
+        sa.Column('description', sa.String(), nullable=True),
+        sa.Column('price', sa.Numeric(10, 2), nullable=True),
+        sa.Column('discount', sa.Integer(), nullable=True),
+        sa.Column('submenu_id', sa.UUID(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ['submenu_id'], ['submenus.id'], ondelete='CASCADE'
+        ),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_dishes_id', 'dishes', ['id'])
+    op.create_index('ix_dishes_title', 'dishes', ['title'], unique=True)
+
+
+def downgrade() -> None:
+    """
+    Функция удаляет таблицы.
+
+    :return: None.
+    """
+    op.drop_table('dishes')
+    op.drop_table('submenus')
+    op.drop_table('menus')
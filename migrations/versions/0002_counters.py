@@ -0,0 +1,70 @@
+"""Счетчики под-меню и блюд в таблицах меню и под-меню.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2023-07-30 12:10:00
+"""
+import sqlalchemy as sa
+from alembic import op
+
+from menu_app.db_triggers import COUNTER_TRIGGERS
+
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Функция добавляет столбцы счетчиков, заполняет их по текущим данным и \
+    создает триггеры, поддерживающие их при изменениях.
+
+    :return: None.
+    """
+    for table, column in (
+            ('menus', 'submenus_count'),
+            ('menus', 'dishes_count'),
+            ('submenus', 'dishes_count'),
+    ):
+        op.add_column(
+            table,
+            sa.Column(column, sa.Integer(), nullable=False, server_default='0')
+        )
+    op.execute(
+        """
+        UPDATE submenus SET dishes_count = (
+            SELECT count(*) FROM dishes WHERE dishes.submenu_id = submenus.id
+        )
+        """
+    )
+    op.execute(
+        """
+        UPDATE menus SET
+            submenus_count = (
+                SELECT count(*) FROM submenus
+                WHERE submenus.menu_id = menus.id
+            ),
+            dishes_count = (
+                SELECT coalesce(sum(submenus.dishes_count), 0) FROM submenus
+                WHERE submenus.menu_id = menus.id
+            )
+        """
+    )
+    for trigger in COUNTER_TRIGGERS:
+        op.execute(trigger)
+
+
+def downgrade() -> None:
+    """
+    Функция удаляет триггеры и столбцы счетчиков.
+
+    :return: None.
+    """
+    op.execute('DROP TRIGGER IF EXISTS submenus_count ON submenus')
+    op.execute('DROP TRIGGER IF EXISTS dishes_count ON dishes')
+    op.execute('DROP FUNCTION IF EXISTS submenus_count_trigger()')
+    op.execute('DROP FUNCTION IF EXISTS dishes_count_trigger()')
+    op.drop_column('submenus', 'dishes_count')
+    op.drop_column('menus', 'dishes_count')
+    op.drop_column('menus', 'submenus_count')
@@ -0,0 +1,43 @@
+"""Индексы внешних ключей под-меню и блюд.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2023-07-30 12:20:00
+"""
+from alembic import op
+
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Функция создает составные индексы по внешнему ключу и идентификатору. \
+    Они используются для поиска дочерних записей при каскадном удалении и \
+    пересчете счетчиков, а также для выборки списков по родителю в порядке \
+    идентификаторов.
+
+    :return: None.
+    """
+    op.create_index(
+        'ix_submenus_menu_id_id',
+        'submenus',
+        ['menu_id', 'id']
+    )
+    op.create_index(
+        'ix_dishes_submenu_id_id',
+        'dishes',
+        ['submenu_id', 'id']
+    )
+
+
+def downgrade() -> None:
+    """
+    Функция удаляет индексы внешних ключей.
+
+    :return: None.
+    """
+    op.drop_index('ix_dishes_submenu_id_id', table_name='dishes')
+    op.drop_index('ix_submenus_menu_id_id', table_name='submenus')
@@ -71,3 +71,26 @@ class BaseTestApp(BaseTestDish):
         :return: Ответ от тестового клиента на get запрос.
         """
         return await self.retrieve_test('full_menu')
+
+    async def app_get_tree_menu_if_none_match(self, etag: str) -> Response:
+        """
+        Метод возвращает ответ на условный get запрос получения древовидного\
+        меню с заголовком If-None-Match.
+
+        :param etag: Значение ETag, полученное в предыдущем ответе.
+        :return: Ответ от тестового клиента на get запрос.
+        """
+        url = await self.client.reverse('full_menu')
+        return await self.client.client.get(
+            url,
+            headers={'If-None-Match': etag}
+        )
+
+    async def app_get_cache_stats(self) -> Response:
+        """
+        Метод использует один из родительских методов для возвращения ответа \
+        на get запрос получения статистики кэша.
+
+        :return: Ответ от тестового клиента на get запрос.
+        """
+        return await self.retrieve_test('cache_stats')
@@ -87,10 +87,12 @@ class BaseTest:
     submenu_id: UUID | None = None
     dish_id: UUID | None = None
     title_menu: str = 'Test menu 1'
+    other_title_menu: str = 'Test menu 2'
     description_menu: str = 'Description test menu 1'
     title_submenu: str = 'Test submenu 1'
     description_submenu: str = 'Description test submenu 1'
     title_dish: str = 'Test dish 1'
+    other_title_dish: str = 'Test dish 2'
     description_dish: str = 'Description test dish 1'
     price_dish: str = '12.53'
     update_title_menu = 'Updated test menu 1'
@@ -161,6 +163,30 @@ class BaseTest:
         """
         return await self.client.get(url_name=url_name, **url_path)
 
+    async def page_test(
+            self,
+            url_name: str,
+            limit: int,
+            after: str | None = None,
+            **url_path
+    ) -> Response:
+        """
+        Метод, используемый в конфигураторах тестов моделей при получении \
+        страницы списка, возвращает ответ на запрос для дальнейшего \
+        тестирования.
+
+        :param url_name: Имя endpoint, указанное в декораторе endpoint.
+        :param limit: Размер страницы.
+        :param after: Курсор из поля next предыдущей страницы.
+        :param url_path: kwargs-параметры пути.
+        :return: Ответ на запрос.
+        """
+        url = await self.client.reverse(url_name, **url_path)
+        params: dict = {'limit': limit}
+        if after:
+            params['after'] = after
+        return await self.client.client.get(url, params=params)
+
     async def update_test(
             self,
             url_name: str,
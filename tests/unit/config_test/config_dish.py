@@ -23,6 +23,7 @@ class BaseTestDish(BaseTestSubmenu):
         }
         self.successful_delete_dish = {'message': 'The dish has been deleted'}
         self.not_found_dish = {'detail': 'dish not found'}
+        self.duplicate_dish = {'detail': 'dish titles are duplicated'}
 
     async def dish_test_create(self) -> Response:
         """
@@ -46,6 +47,71 @@ class BaseTestDish(BaseTestSubmenu):
         self.check_data_dish['id'] = dish_id
         return response
 
+    async def dish_test_create_other(self) -> Response:
+        """
+        Метод создания второго блюда, используемый в тестах пагинации.
+
+        :return: Ответ на запрос.
+        """
+        test_entity = {
+            'title': self.other_title_dish,
+            'description': self.description_dish,
+            'price': self.price_dish
+        }
+        return await self.create_test(
+            'create_dish',
+            test_entity,
+            menu_id=self.menu_id,
+            submenu_id=self.submenu_id
+        )
+
+    async def dish_test_bulk_create(self) -> Response:
+        """
+        Метод создания блюд списком, используемый в тестах для проверки. \
+        Создаются тестовое блюдо и обновленное тестовое блюдо.
+
+        :return: Ответ на запрос.
+        """
+        url = await self.client.reverse(
+            'bulk_create_dish',
+            menu_id=self.menu_id,
+            submenu_id=self.submenu_id
+        )
+        return await self.client.client.post(
+            url,
+            json=[
+                {
+                    'title': self.title_dish,
+                    'description': self.description_dish,
+                    'price': self.price_dish
+                },
+                {
+                    'title': self.update_title_dish,
+                    'description': self.update_description_dish,
+                    'price': self.update_price_dish
+                }
+            ]
+        )
+
+    async def dish_test_bulk_create_duplicate(self) -> Response:
+        """
+        Метод создания списком двух блюд с одинаковым названием, \
+        используемый в тестах для проверки.
+
+        :return: Ответ на запрос.
+        """
+        url = await self.client.reverse(
+            'bulk_create_dish',
+            menu_id=self.menu_id,
+            submenu_id=self.submenu_id
+        )
+        dish = {
+            'title': self.title_dish,
+            'description': self.description_dish,
+            'price': self.price_dish
+        }
+        return await self.client.client.post(url, json=[dish, dish])
+
     async def dish_test_get_list(self) -> Response:
         """
         Метод запроса списка блюд, используемый в тестах для проверки.
@@ -58,6 +124,27 @@ class BaseTestDish(BaseTestSubmenu):
             submenu_id=self.submenu_id
         )
 
+    async def dish_test_get_page(
+            self,
+            limit: int,
+            after: str | None = None
+    ) -> Response:
+        """
+        Метод запроса страницы списка блюд, используемый в тестах для \
+        проверки пагинации.
+
+        :param limit: Размер страницы.
+        :param after: Курсор из поля next предыдущей страницы.
+        :return: Ответ на запрос.
+        """
+        return await self.page_test(
+            'get_list_dish',
+            limit,
+            after,
+            menu_id=self.menu_id,
+            submenu_id=self.submenu_id
+        )
+
     async def dish_test_get(self) -> Response:
         """
         Метод запроса конкретного блюда по идентификатору, используемый в \
@@ -103,3 +190,17 @@ class BaseTestDish(BaseTestSubmenu):
             submenu_id=self.submenu_id,
             dish_id=self.dish_id
         )
+
+    async def dish_test_delete_other(self, dish_id: str) -> Response:
+        """
+        Метод удаления второго блюда, используемый в тестах пагинации.
+
+        :param dish_id: Идентификатор второго блюда.
+        :return: Ответ на запрос.
+        """
+        return await self.delete_test(
+            'delete_dish',
+            menu_id=self.menu_id,
+            submenu_id=self.submenu_id,
+            dish_id=dish_id
+        )
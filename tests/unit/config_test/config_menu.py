@@ -40,6 +40,18 @@ class BaseTestMenu(BaseTest):
         self.check_data_menu['id'] = menu_id
         return response
 
+    async def menu_test_create_other(self) -> Response:
+        """
+        Метод создания второго меню, используемый в тестах пагинации.
+
+        :return: Ответ на запрос.
+        """
+        test_entity = {
+            'title': self.other_title_menu,
+            'description': self.description_menu
+        }
+        return await self.create_test('create_menu', test_entity)
+
     async def menu_test_get_list(self) -> Response:
         """
         Метод запроса списка меню, используемый в тестах для проверки.
@@ -48,6 +60,21 @@ class BaseTestMenu(BaseTest):
         """
         return await self.retrieve_test('get_list_menu')
 
+    async def menu_test_get_page(
+            self,
+            limit: int,
+            after: str | None = None
+    ) -> Response:
+        """
+        Метод запроса страницы списка меню, используемый в тестах для \
+        проверки пагинации.
+
+        :param limit: Размер страницы.
+        :param after: Курсор из поля next предыдущей страницы.
+        :return: Ответ на запрос.
+        """
+        return await self.page_test('get_list_menu', limit, after)
+
     async def menu_test_get(self) -> Response:
         """
         Метод запроса конкретного меню по идентификатору, используемый в \
@@ -80,3 +107,12 @@ class BaseTestMenu(BaseTest):
         :return: Ответ на запрос.
         """
         return await self.delete_test('delete_menu', menu_id=self.menu_id)
+
+    async def menu_test_delete_other(self, menu_id: str) -> Response:
+        """
+        Метод удаления второго меню, используемый в тестах пагинации.
+
+        :param menu_id: Идентификатор второго меню.
+        :return: Ответ на запрос.
+        """
+        return await self.delete_test('delete_menu', menu_id=menu_id)
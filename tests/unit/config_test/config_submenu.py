@@ -1,4 +1,6 @@
 """Модуль дополнительной конфигурации тестов CRUD для модели Submenu."""
+from uuid import uuid4
+
 from .config_menu import BaseTestMenu
 
 
@@ -54,6 +56,18 @@ class BaseTestSubmenu(BaseTestMenu):
             menu_id=self.menu_id
         )
 
+    async def submenu_test_get_list_other_menu(self):
+        """
+        Метод запроса списка под-меню несуществующего меню, используемый в \
+        тестах для проверки фильтрации списка по меню.
+
+        :return: Ответ на запрос.
+        """
+        return await self.retrieve_test(
+            'get_list_submenu',
+            menu_id=str(uuid4())
+        )
+
     async def submenu_test_get(self):
         """
         Метод запроса конкретного под-меню по идентификатору, используемый в \
@@ -9,7 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engin
 from sqlalchemy.orm import DeclarativeBase, declarative_base, sessionmaker
 
 from menu_app.config import config
-from menu_app.database import Base, get_db
+from menu_app.database import Base, get_db, get_read_db
 from menu_app.main import app
 
 test_sqlalchemy_url: str = (
@@ -73,3 +73,4 @@ def event_loop() -> Generator:
 
 
 app.dependency_overrides[get_db] = override_get_db
+app.dependency_overrides[get_read_db] = override_get_db
@@ -53,6 +53,37 @@ class TestGetTreeMenu:
         assert response.status_code == 200
         assert response.json() == self.base.check_data_app
 
+    async def test_get_tree_menu_not_modified(self) -> None:
+        """
+        Проверка, что повторный запрос древовидного меню с полученным ETag \
+        возвращает ответ 304 без тела, а с другим ETag - полный ответ.
+
+        :return: None.
+        """
+        response: Response = await self.base.app_get_tree_menu()
+        etag = response.headers['ETag']
+        response = await self.base.app_get_tree_menu_if_none_match(etag)
+        assert response.status_code == 304
+        assert response.content == b''
+        response = await self.base.app_get_tree_menu_if_none_match('"old"')
+        assert response.status_code == 200
+        assert response.json() == self.base.check_data_app
+
+    async def test_get_cache_stats(self) -> None:
+        """
+        Проверка, что статистика кэша учитывает запросы древовидного меню и \
+        инвалидации при создании сущностей.
+
+        :return: None.
+        """
+        response: Response = await self.base.app_get_cache_stats()
+        assert response.status_code == 200
+        stats = response.json()
+        tree = stats['families']['tree']
+        assert tree['hits'] + tree['misses'] >= 3
+        assert 0 <= tree['hit_rate'] <= 1
+        assert tree['invalidations'] >= 3
+
     async def test_remove_menu(self) -> None:
         """
         Удаление меню и связанных элементов. Проверка получения положительного\
@@ -51,6 +51,38 @@ class TestCRUDDish:
         assert response.status_code == 201
         assert response.json() == self.base.check_data_dish
 
+    async def test_get_page_dish(self) -> None:
+        """
+        Получение списка из двух блюд по страницам: первая страница \
+        возвращает курсор, по которому вторая страница возвращает второе \
+        блюдо без курсора. Второе блюдо после проверки удаляется.
+
+        :return: None.
+        """
+        response: Response = await self.base.dish_test_create_other()
+        assert response.status_code == 201
+        other = response.json()
+        response = await self.base.dish_test_get_page(limit=1)
+        assert response.status_code == 200
+        first = response.json()
+        assert len(first['items']) == 1
+        assert first['next'] == first['items'][0]['id']
+        response = await self.base.dish_test_get_page(
+            limit=1,
+            after=first['next']
+        )
+        assert response.status_code == 200
+        second = response.json()
+        assert len(second['items']) == 1
+        assert second['next'] is None
+        assert first['items'][0]['id'] < second['items'][0]['id']
+        assert sorted(
+            first['items'] + second['items'],
+            key=lambda dish: dish['title']
+        ) == [self.base.check_data_dish, other]
+        response = await self.base.dish_test_delete_other(other['id'])
+        assert response.status_code == 200
+
     async def test_get_dish(self) -> None:
         """
         Получение конкретного блюда.
@@ -91,6 +123,42 @@ class TestCRUDDish:
         assert response.status_code == 404
         assert response.json() == self.base.not_found_dish
 
+    async def test_bulk_create_dish(self) -> None:
+        """
+        Создание блюд списком. Повторный запрос обновляет те же блюда, не \
+        создавая новых.
+
+        :return: None.
+        """
+        response: Response = await self.base.dish_test_bulk_create()
+        assert response.status_code == 201
+        created = response.json()
+        assert [
+            {key: value for key, value in dish.items() if key != 'id'}
+            for dish in created
+        ] == [
+            {key: value for key, value in data.items() if key != 'id'}
+            for data in (
+                self.base.check_data_dish,
+                self.base.update_check_data_dish
+            )
+        ]
+        response = await self.base.dish_test_bulk_create()
+        assert response.status_code == 201
+        assert response.json() == created
+        response = await self.base.dish_test_get_list()
+        assert len(response.json()) == 2
+
+    async def test_bulk_create_duplicate_dish(self) -> None:
+        """
+        Проверка отказа в создании списком блюд с одинаковым названием.
+
+        :return: None.
+        """
+        response: Response = await self.base.dish_test_bulk_create_duplicate()
+        assert response.status_code == 422
+        assert response.json() == self.base.duplicate_dish
+
     async def test_delete_menu(self) -> None:
         """
         Удаление меню после тестов.
@@ -32,6 +32,38 @@ class TestCRUDMenu:
         assert response.status_code == 201
         assert response.json() == self.base.check_data_menu
 
+    async def test_get_page_menu(self) -> None:
+        """
+        Получение списка из двух меню по страницам: первая страница \
+        возвращает курсор, по которому вторая страница возвращает второе \
+        меню без курсора. Второе меню после проверки удаляется.
+
+        :return: None.
+        """
+        response: Response = await self.base.menu_test_create_other()
+        assert response.status_code == 201
+        other = response.json()
+        response = await self.base.menu_test_get_page(limit=1)
+        assert response.status_code == 200
+        first = response.json()
+        assert len(first['items']) == 1
+        assert first['next'] == first['items'][0]['id']
+        response = await self.base.menu_test_get_page(
+            limit=1,
+            after=first['next']
+        )
+        assert response.status_code == 200
+        second = response.json()
+        assert len(second['items']) == 1
+        assert second['next'] is None
+        assert first['items'][0]['id'] < second['items'][0]['id']
+        assert sorted(
+            first['items'] + second['items'],
+            key=lambda menu: menu['title']
+        ) == [self.base.check_data_menu, other]
+        response = await self.base.menu_test_delete_other(other['id'])
+        assert response.status_code == 200
+
     async def test_get_menu(self) -> None:
         """
         Получение конкретного меню после создания.
@@ -71,3 +103,23 @@ class TestCRUDMenu:
         response: Response = await self.base.menu_test_get()
         assert response.status_code == 404
         assert response.json() == self.base.not_found_menu
+
+    async def test_update_not_found_menu(self) -> None:
+        """
+        Проверка ответа при обновлении удаленного меню.
+
+        :return: None.
+        """
+        response: Response = await self.base.menu_test_update()
+        assert response.status_code == 404
+        assert response.json() == self.base.not_found_menu
+
+    async def test_delete_not_found_menu(self) -> None:
+        """
+        Проверка ответа при повторном удалении меню.
+
+        :return: None.
+        """
+        response: Response = await self.base.menu_test_delete()
+        assert response.status_code == 404
+        assert response.json() == self.base.not_found_menu
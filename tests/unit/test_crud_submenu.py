@@ -42,6 +42,16 @@ class TestCRUDSubmenu:
         assert response.status_code == 201
         assert response.json() == self.base.check_data_submenu
 
+    async def test_get_list_submenu_other_menu(self) -> None:
+        """
+        Проверка отсутствия созданного под-меню в списке другого меню.
+
+        :return: None.
+        """
+        response: Response = await self.base.submenu_test_get_list_other_menu()
+        assert response.status_code == 200
+        assert response.json() == []
+
     async def test_get_submenu(self) -> None:
         """
         Получение конкретного под-меню после создания.